@@ -9,12 +9,16 @@ Usage:
     python demo_voice_copilot.py
 """
 
+import asyncio
 import os
+import re
 import sys
-import time
 import json
 from typing import Optional
 
+import aiohttp
+import numpy as np
+
 # Add the current directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -30,6 +34,18 @@ except ImportError as e:
     MicrophoneRecorder = None
 
 
+# Canned demo responses, in priority order when several keywords match
+RESPONSES = {
+    "hello": "Hello! How can I help you with your coding today?",
+    "how are you": "I'm doing well, thank you for asking! I'm here to help you with any programming questions or tasks you might have.",
+    "what is python": "Python is a high-level, interpreted programming language known for its simplicity and readability. It's widely used for web development, data science, machine learning, and automation.",
+    "help": "I'd be happy to help! You can ask me about programming concepts, debugging code, writing functions, or any other development-related questions.",
+}
+_PRIORITY = {keyword: i for i, keyword in enumerate(RESPONSES)}
+# One alternation scans the transcription once instead of once per keyword
+_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, sorted(RESPONSES, key=len, reverse=True))))
+
+
 class VoiceCopilotDemo:
     """Demo class showing voice-to-Copilot integration."""
 
@@ -40,6 +56,8 @@ class VoiceCopilotDemo:
         self.mcp_client = MCPClient()
         self.microphone = MicrophoneRecorder()
         self.is_running = False
+        self._loop = asyncio.new_event_loop()
+        self._http: Optional[aiohttp.ClientSession] = None
 
     def run_interactive_demo(self):
         """Run an interactive voice-to-Copilot demo."""
@@ -109,80 +127,77 @@ class VoiceCopilotDemo:
 
             # Start recording for 5 seconds (you can make this configurable)
             print("🎤 Recording for 5 seconds...")
-            self.microphone.start_recording(device_index, duration=5)
+            if not self.microphone.start_recording(device_index, duration=5):
+                return
 
             # Wait for recording to complete
-            time.sleep(6)  # A bit longer than recording duration
+            self.microphone.recording_complete.wait()
 
             # Process the recording
-            self.process_recording()
+            self._loop.run_until_complete(self.process_recording())
 
         except Exception as e:
             print(f"❌ Recording failed: {e}")
 
-    def process_recording(self):
+    async def process_recording(self):
         """Process the recorded audio through ASR and MCP."""
         try:
             print("⏳ Processing recording...")
 
             # Get the recorded audio data
-            if not hasattr(self.microphone, 'frames') or not self.microphone.frames:
+            if not self.microphone.num_samples:
                 print("❌ No audio data recorded")
                 return
 
-            # Save to temporary WAV file
-            import tempfile
-            import wave
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_path = temp_file.name
-
-                # Write WAV file
-                with wave.open(temp_path, 'wb') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(16000)
-                    wf.writeframes(b''.join(self.microphone.frames))
+            # Convert int16 PCM to float32 samples in [-1, 1]
+            audio = self.microphone.recorded_audio.astype(np.float32) / 32768.0
 
             # Transcribe using ASR service
-            transcription = self.transcribe_audio(temp_path)
+            transcription = await self.transcribe_audio(audio, self.microphone.rate)
 
             if transcription:
                 print(f"📝 Transcription: {transcription}")
 
                 # Send to Copilot
-                self.send_to_copilot_demo(transcription)
+                await self.send_to_copilot_demo(transcription)
             else:
                 print("❌ Transcription failed")
 
-            # Cleanup
-            os.unlink(temp_path)
-
         except Exception as e:
             print(f"❌ Processing failed: {e}")
 
-    def transcribe_audio(self, audio_path: str) -> Optional[str]:
-        """Send audio to ASR service for transcription."""
+    async def transcribe_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
+        """Send raw float32 PCM audio to ASR service for transcription."""
         try:
-            import requests
-
-            asr_url = os.getenv("ASR_URL", "http://localhost:8000/transcribe")
-
-            with open(audio_path, "rb") as f:
-                response = requests.post(asr_url, files={"file": f}, timeout=30)
-
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("text", "").strip()
-            else:
-                print(f"❌ ASR Error: {response.status_code}")
-                return None
+            asr_url = os.getenv("ASR_RAW_URL", "http://localhost:8000/transcribe_raw")
+
+            async with self._get_http().post(
+                asr_url,
+                data=audio.tobytes(),
+                params={"sample_rate": sample_rate},
+                headers={"Content-Type": "application/octet-stream"}
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return result.get("text", "").strip()
+                else:
+                    print(f"❌ ASR Error: {response.status}")
+                    return None
 
         except Exception as e:
             print(f"❌ ASR request failed: {e}")
             return None
 
-    def send_to_copilot_demo(self, transcription: str):
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=4)
+            )
+        return self._http
+
+    async def send_to_copilot_demo(self, transcription: str):
         """Send transcription to Copilot and display response."""
         print("🤖 Sending to Copilot...")
 
@@ -190,7 +205,7 @@ class VoiceCopilotDemo:
         prompt = self.mcp_client.create_prompt_from_transcription(transcription)
         print(f"📤 Prompt: {prompt.text}")
 
-        # In a real implementation, you would send this to Copilot
+        # In a real implementation, you would await the MCP call here
         # For demo purposes, we'll simulate a response
         simulated_response = self.simulate_copilot_response(transcription)
 
@@ -203,19 +218,10 @@ class VoiceCopilotDemo:
         # This is just for demonstration
         # In a real implementation, you would use the MCP client to get actual responses
 
-        responses = {
-            "hello": "Hello! How can I help you with your coding today?",
-            "how are you": "I'm doing well, thank you for asking! I'm here to help you with any programming questions or tasks you might have.",
-            "what is python": "Python is a high-level, interpreted programming language known for its simplicity and readability. It's widely used for web development, data science, machine learning, and automation.",
-            "help": "I'd be happy to help! You can ask me about programming concepts, debugging code, writing functions, or any other development-related questions.",
-        }
-
         # Simple keyword matching
-        transcription_lower = transcription.lower()
-
-        for keyword, response in responses.items():
-            if keyword in transcription_lower:
-                return response
+        matches = [m.group(0) for m in _KEYWORD_PATTERN.finditer(transcription.lower())]
+        if matches:
+            return RESPONSES[min(matches, key=_PRIORITY.__getitem__)]
 
         # Default response
         return f"I understand you said: '{transcription}'. That's an interesting question! Could you provide more details about what you'd like help with?"
@@ -233,6 +239,9 @@ class VoiceCopilotDemo:
         """Clean up resources."""
         if hasattr(self.microphone, 'audio'):
             self.microphone.audio.terminate()
+        if self._http is not None:
+            self._loop.run_until_complete(self._http.close())
+        self._loop.close()
 
 
 def main():
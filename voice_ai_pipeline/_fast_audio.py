@@ -0,0 +1,127 @@
+"""Numeric helpers for int16 PCM audio.
+
+The loops are JIT-compiled with Numba when it is installed; otherwise
+equivalent vectorized NumPy implementations are used. Numba itself is only
+imported on the first call, since importing it (and LLVM) takes longer than
+most callers spend in these helpers.
+"""
+
+import functools
+import importlib.util
+from typing import Any, Tuple
+
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Amplitude below which int16 samples count as silence (about -36 dBFS)
+SILENCE_THRESHOLD = 500
+
+# RMS above which a chunk counts as voice activity
+VOICE_RMS_THRESHOLD = 100
+
+
+def _speech_bounds_numpy(pcm: np.ndarray, threshold: int) -> Tuple[int, int]:
+    loud = np.flatnonzero(np.abs(pcm.astype(np.int32)) >= threshold)
+    if loud.size == 0:
+        return 0, 0
+    return int(loud[0]), int(loud[-1]) + 1
+
+
+def _rms_energy_numpy(pcm: np.ndarray) -> float:
+    if pcm.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(np.square(pcm, dtype=np.float64))))
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels() -> Tuple[Any, Any]:
+    """Import Numba and build the JIT kernels (compiled lazily on their first call)."""
+    from numba import njit, prange  # type: ignore
+
+    @njit(cache=True)
+    def speech_bounds_numba(pcm, threshold):
+        # Scans inward from both ends, so only the silent head/tail is touched
+        start = 0
+        while start < pcm.size and abs(np.int32(pcm[start])) < threshold:
+            start += 1
+        end = pcm.size
+        while end > start and abs(np.int32(pcm[end - 1])) < threshold:
+            end -= 1
+        return start, end
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def rms_energy_numba(pcm):
+        total = 0.0
+        for i in prange(pcm.size):
+            total += float(pcm[i]) * float(pcm[i])
+        return np.sqrt(total / pcm.size) if pcm.size else 0.0
+
+    return speech_bounds_numba, rms_energy_numba
+
+
+def speech_bounds(pcm: np.ndarray, threshold: int = SILENCE_THRESHOLD) -> Tuple[int, int]:
+    """
+    Find the span between the first and last non-silent samples.
+
+    Args:
+        pcm: int16 PCM samples
+        threshold: Minimum absolute amplitude of a non-silent sample
+
+    Returns:
+        Tuple of (start, end) sample indices; (0, 0) if the audio is all silence
+    """
+    if NUMBA_AVAILABLE:
+        start, end = _numba_kernels()[0](pcm, threshold)
+        return int(start), int(end)
+    return _speech_bounds_numpy(pcm, threshold)
+
+
+def trim_silence(pcm: np.ndarray, threshold: int = SILENCE_THRESHOLD) -> np.ndarray:
+    """
+    Drop leading and trailing silence.
+
+    Args:
+        pcm: int16 PCM samples
+        threshold: Minimum absolute amplitude of a non-silent sample
+
+    Returns:
+        View of ``pcm`` without its silent head and tail
+    """
+    start, end = speech_bounds(pcm, threshold)
+    return pcm[start:end]
+
+
+def rms_energy(pcm: np.ndarray) -> float:
+    """
+    Compute the root-mean-square amplitude of the samples.
+
+    Args:
+        pcm: int16 PCM samples
+
+    Returns:
+        RMS amplitude (0.0 for empty input)
+    """
+    if NUMBA_AVAILABLE:
+        return float(_numba_kernels()[1](pcm))
+    return _rms_energy_numpy(pcm)
+
+
+def is_voiced(pcm: np.ndarray, threshold: float = VOICE_RMS_THRESHOLD) -> bool:
+    """
+    Check whether a chunk's RMS amplitude exceeds ``threshold``.
+
+    Compares the mean square against ``threshold ** 2`` so the per-chunk check
+    needs no square root; the sum of squares is a single dot product.
+
+    Args:
+        pcm: int16 PCM samples
+        threshold: RMS amplitude that counts as voice activity
+
+    Returns:
+        True if the chunk is louder than the threshold
+    """
+    if pcm.size == 0:
+        return False
+    samples = pcm.astype(np.int64)
+    return int(np.dot(samples, samples)) > threshold * threshold * pcm.size
@@ -0,0 +1,60 @@
+"""requests transport for HTTP over a Unix domain socket.
+
+Used when the ASR service runs on the same host: requests to its URL are
+sent through the socket file instead of TCP loopback, skipping the kernel's
+TCP/IP stack. The URL's host and port are still used for the Host header
+and connection-pool key, but no TCP connection is made.
+"""
+
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """HTTP connection whose socket is a Unix stream socket at ``socket_path``."""
+
+    socket_path = ""
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # urllib3 uses a sentinel object when no timeout was given
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Transport adapter sending plain-HTTP requests over a Unix domain socket.
+
+    Mount it on the service's base URL so only requests to that service use
+    the socket::
+
+        session.mount("http://localhost:8000", UnixSocketAdapter("/run/asr.sock"))
+    """
+
+    def __init__(self, socket_path: str, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            socket_path: Path of the Unix socket the server listens on
+            **kwargs: Passed to ``HTTPAdapter`` (pool sizes, retries)
+        """
+        self.socket_path = socket_path
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        connection_cls = type("UnixHTTPConnection", (_UnixHTTPConnection,),
+                              {"socket_path": self.socket_path})
+        pool_cls = type("UnixHTTPConnectionPool", (HTTPConnectionPool,),
+                        {"ConnectionCls": connection_cls})
+        self.poolmanager.pool_classes_by_scheme = {"http": pool_cls}
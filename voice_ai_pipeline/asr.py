@@ -1,12 +1,26 @@
 """ASR service using Whisper for speech-to-text transcription."""
 
+import asyncio
+import hashlib
 import os
-from typing import Dict, List
-from faster_whisper import WhisperModel
-from fastapi import FastAPI, UploadFile, HTTPException
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (Any, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Mapping, Optional,
+                    Tuple, TypeVar)
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from fastapi import FastAPI, UploadFile, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+import numpy as np
+from scipy.signal import resample_poly
 import tempfile
 import torch
 
+SAMPLE_RATE = 16000
+SUPPORTED_FORMATS = (".wav", ".mp3", ".flac", ".m4a", ".ogg", ".webm")
+
+T = TypeVar("T")
+
 
 class ASR:
     """Automatic Speech Recognition service using OpenAI's Whisper model.
@@ -15,17 +29,49 @@ class ASR:
     audio files to text.
     """
 
-    def __init__(self, model_name: str = "small", use_gpu: bool | None = None) -> None:
+    def __init__(self, model_name: str = "small", use_gpu: bool | None = None,
+                 compute_type: str | None = None, download_root: str | None = None,
+                 flash_attention: bool = False, beam_size: int = 1,
+                 vad_filter: bool = True, num_workers: int = 2,
+                 backend: str = "faster_whisper", ov_device: str = "GPU") -> None:
         """Initialize the ASR service.
 
         Args:
             model_name: The name/size of the Whisper model to use.
                 Options: "tiny", "base", "small", "medium", "large".
             use_gpu: Whether to use GPU acceleration. If None, auto-detect GPU availability.
+            compute_type: CTranslate2 compute type for the model weights. If None,
+                uses "int8_float16" on GPU and "int8" on CPU.
+            download_root: Directory where model weights are downloaded and cached.
+                If None, the Hugging Face cache directory is used.
+            flash_attention: Whether to use flash attention on GPU. Requires an
+                Ampere or newer GPU.
+            beam_size: Beam width used for decoding. 1 selects greedy decoding.
+            vad_filter: Whether to skip silent regions with the Silero VAD model
+                before decoding.
+            num_workers: Number of model workers, allowing that many transcriptions
+                to run in parallel. CPU threads are split evenly between workers.
+            backend: Inference backend. "faster_whisper" uses CTranslate2;
+                "whispercpp" uses whisper.cpp through pywhispercpp; "openvino"
+                uses an OpenVINO GenAI WhisperPipeline, with ``model_name`` pointing
+                to an exported OpenVINO model directory.
+            ov_device: OpenVINO device for the "openvino" backend, e.g. "GPU",
+                "NPU" or "CPU".
         """
         self.model_name = model_name
         self.use_gpu = use_gpu if use_gpu is not None else self._detect_gpu()
-        self.model: WhisperModel | None = None
+        self.compute_type = compute_type or ("int8_float16" if self.use_gpu else "int8")
+        self.download_root = download_root
+        self.flash_attention = flash_attention
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        self.num_workers = num_workers
+        self.cpu_threads = max(1, (os.cpu_count() or 1) // num_workers)
+        self.backend = backend
+        self.ov_device = ov_device
+        self.model: Any = None
+        self.batched: BatchedInferencePipeline | None = None
+        self._info: Mapping[str, str] = MappingProxyType({})
         self.load_model()
 
     def _detect_gpu(self) -> bool:
@@ -40,21 +86,50 @@ class ASR:
             return False
 
     def load_model(self) -> None:
-        """Load the Whisper model into memory.
+        """Load the Whisper model into memory using the configured backend.
+
+        Raises:
+            RuntimeError: If model loading fails or the backend is unknown.
+        """
+        if self.backend == "faster_whisper":
+            self._load_faster_whisper()
+        elif self.backend == "whispercpp":
+            self._load_whispercpp()
+        elif self.backend == "openvino":
+            self._load_openvino()
+        else:
+            raise RuntimeError(f"Unknown ASR backend: {self.backend}")
+
+        # Loaders may fall back to another device, so snapshot the info afterwards
+        self._info = MappingProxyType({
+            "model_name": self.model_name,
+            "backend": self.backend,
+            "device": (self.ov_device.lower() if self.backend == "openvino"
+                       else "cuda" if self.use_gpu else "cpu"),
+            "compute_type": self.compute_type,
+            "loaded": str(self.model is not None)
+        })
+
+    def _load_faster_whisper(self) -> None:
+        """Load the model with faster-whisper (CTranslate2).
 
         Raises:
             RuntimeError: If model loading fails.
         """
         try:
             device = "cuda" if self.use_gpu else "cpu"
-            compute_type = "float16" if self.use_gpu else "int8"
 
-            print(f"Loading ASR model '{self.model_name}' on {device} with compute_type={compute_type}")
+            print(f"Loading ASR model '{self.model_name}' on {device} "
+                  f"with compute_type={self.compute_type}")
 
             self.model = WhisperModel(
                 self.model_name,
                 device=device,
-                compute_type=compute_type
+                compute_type=self.compute_type,
+                download_root=self.download_root,
+                flash_attention=self.use_gpu and self.flash_attention,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers
             )
             print(f"ASR model loaded successfully on {device}")
         except Exception as e:
@@ -62,11 +137,15 @@ class ASR:
             if self.use_gpu:
                 print(f"GPU loading failed ({e}), falling back to CPU...")
                 self.use_gpu = False
+                self.compute_type = "int8"
                 try:
                     self.model = WhisperModel(
                         self.model_name,
                         device="cpu",
-                        compute_type="int8"
+                        compute_type="int8",
+                        download_root=self.download_root,
+                        cpu_threads=self.cpu_threads,
+                        num_workers=self.num_workers
                     )
                     print("ASR model loaded successfully on CPU (fallback)")
                 except Exception as cpu_e:
@@ -74,43 +153,191 @@ class ASR:
             else:
                 raise RuntimeError(f"Failed to load ASR model {self.model_name}: {e}")
 
-    def transcribe(self, audio_path: str) -> str:
-        """Transcribe an audio file to text.
+        self.batched = BatchedInferencePipeline(model=self.model)
+
+    def _load_whispercpp(self) -> None:
+        """Load the model with whisper.cpp, using its AVX2/AVX-512 int8 CPU kernels.
+
+        Raises:
+            RuntimeError: If pywhispercpp is not installed or model loading fails.
+        """
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            raise RuntimeError("whispercpp backend requires pywhispercpp. "
+                               "Install with: pip install pywhispercpp")
+
+        n_threads = os.cpu_count() or 1
+        print(f"Loading ASR model '{self.model_name}' with whisper.cpp using {n_threads} threads")
+        try:
+            self.model = Model(self.model_name, n_threads=n_threads)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load ASR model {self.model_name} with whisper.cpp: {e}")
+        self.use_gpu = False
+        self.compute_type = "ggml"
+        print("ASR model loaded successfully with whisper.cpp")
+
+    def _load_openvino(self) -> None:
+        """Load the model with OpenVINO GenAI for Intel GPU/NPU/CPU inference.
+
+        Compiled blobs are cached under ``download_root`` (or ``OV_CACHE_DIR``)
+        so later starts skip device compilation, which is slow on GPU and NPU.
+
+        Raises:
+            RuntimeError: If openvino-genai is not installed or model loading fails.
+        """
+        try:
+            import openvino_genai
+        except ImportError:
+            raise RuntimeError("openvino backend requires openvino-genai. "
+                               "Install with: pip install openvino-genai")
+
+        cache_dir = self.download_root or os.getenv("OV_CACHE_DIR", "ov_cache")
+        print(f"Loading ASR model '{self.model_name}' with OpenVINO on {self.ov_device}")
+        try:
+            self.model = openvino_genai.WhisperPipeline(self.model_name, self.ov_device,
+                                                        CACHE_DIR=cache_dir)
+        except Exception as e:
+            if self.ov_device == "CPU":
+                raise RuntimeError(f"Failed to load ASR model {self.model_name} with OpenVINO: {e}")
+            print(f"OpenVINO {self.ov_device} loading failed ({e}), falling back to CPU...")
+            self.ov_device = "CPU"
+            try:
+                self.model = openvino_genai.WhisperPipeline(self.model_name, "CPU",
+                                                            CACHE_DIR=cache_dir)
+            except Exception as cpu_e:
+                raise RuntimeError(
+                    f"Failed to load ASR model {self.model_name} with OpenVINO: {cpu_e}")
+        self.use_gpu = False
+        self.compute_type = "openvino"
+        print(f"ASR model loaded successfully with OpenVINO on {self.ov_device}")
+
+    def warmup(self) -> None:
+        """Run a dummy transcription to initialize the decoder.
+
+        Transcribing one second of silence allocates the decoder buffers and
+        triggers kernel selection so the first real request does not pay for it.
+        VAD is disabled for this call, since it would strip the silence and
+        skip the decoder entirely.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        if self.model is None:
+            raise RuntimeError("ASR model not loaded")
+
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        for _ in self.transcribe_segments(silence, vad_filter=False):
+            pass
+
+    def transcribe(self, audio: str | BinaryIO | np.ndarray) -> str:
+        """Transcribe audio to text.
 
         Args:
-            audio_path: Path to the audio file to transcribe.
+            audio: Path or binary file object of the audio file to transcribe,
+                or mono float32 PCM samples at 16 kHz.
 
         Returns:
             The transcribed text.
 
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        return "".join(self.transcribe_segments(audio))
+
+    def transcribe_segments(self, audio: str | BinaryIO | np.ndarray,
+                            vad_filter: bool | None = None) -> Iterator[str]:
+        """Transcribe audio, yielding segment texts as they are decoded.
+
+        Args:
+            audio: Path or binary file object of the audio file to transcribe,
+                or mono float32 PCM samples at 16 kHz.
+            vad_filter: Override the service's VAD setting for this call
+                (faster-whisper backend only); None uses ``self.vad_filter``.
+
+        Yields:
+            The text of each decoded segment, in order.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        if self.model is None:
+            raise RuntimeError("ASR model not loaded")
+
+        if self.backend == "whispercpp":
+            if not isinstance(audio, (str, np.ndarray)):
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            for segment in self.model.transcribe(audio):
+                yield segment.text
+            return
+
+        if self.backend == "openvino":
+            if not isinstance(audio, np.ndarray):
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            result = self.model.generate(audio, return_timestamps=True)
+            for chunk in result.chunks:
+                yield chunk.text
+            return
+
+        segments, info = self.model.transcribe(
+            audio,
+            beam_size=self.beam_size,
+            temperature=0.0,
+            vad_filter=self.vad_filter if vad_filter is None else vad_filter,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False
+        )
+        for segment in segments:
+            yield segment.text
+
+    def transcribe_batch(self, paths: List[str | BinaryIO], batch_size: int = 16) -> List[str]:
+        """Transcribe several audio files using the batched inference pipeline.
+
+        Each file is split into VAD chunks which are decoded together in
+        batches of ``batch_size``, keeping the decoder busy on the GPU.
+        Backends without a batched pipeline transcribe the files one by one.
+
+        Args:
+            paths: Paths or binary file objects of the audio files to transcribe.
+            batch_size: Number of audio chunks decoded per forward pass.
+
+        Returns:
+            The transcribed text for each file, in the same order as ``paths``.
+
         Raises:
             RuntimeError: If the model is not loaded.
         """
         if self.model is None:
             raise RuntimeError("ASR model not loaded")
 
-        segments, info = self.model.transcribe(audio_path)
-        return "".join([segment.text for segment in segments])
+        if self.batched is None:
+            return [self.transcribe(path) for path in paths]
+
+        texts = []
+        for path in paths:
+            segments, info = self.batched.transcribe(
+                path,
+                batch_size=batch_size,
+                beam_size=self.beam_size
+            )
+            texts.append("".join(segment.text for segment in segments))
+        return texts
 
-    def get_supported_formats(self) -> List[str]:
-        """Get the list of supported audio file formats.
+    def get_supported_formats(self) -> Tuple[str, ...]:
+        """Get the supported audio file formats.
 
         Returns:
-            List of supported file extensions.
+            Tuple of supported file extensions.
         """
-        return [".wav", ".mp3", ".flac"]
+        return SUPPORTED_FORMATS
 
-    def get_model_info(self) -> Dict[str, str]:
+    def get_model_info(self) -> Mapping[str, str]:
         """Get information about the loaded model.
 
         Returns:
-            Dictionary containing model information.
+            Read-only mapping containing model information, built once at load time.
         """
-        return {
-            "model_name": self.model_name,
-            "device": "cuda" if self.use_gpu else "cpu",
-            "loaded": str(self.model is not None)
-        }
+        return self._info
 
     def is_healthy(self) -> bool:
         """Check if the ASR service is healthy.
@@ -121,14 +348,189 @@ class ASR:
         return self.model is not None
 
 
+class TranscriptionCache:
+    """LRU cache of transcriptions keyed by a digest of the audio content.
+
+    Lets repeated submissions of identical audio (retries, demo loops) skip
+    decoding entirely.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of transcriptions kept. 0 disables caching.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached transcription.
+
+        Args:
+            key: Digest of the audio content.
+
+        Returns:
+            The cached text, or None on a miss.
+        """
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store a transcription, evicting the least recently used entry if full.
+
+        Args:
+            key: Digest of the audio content.
+            text: The transcribed text.
+        """
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
 app = FastAPI(title="ASR Service", description="Speech-to-text transcription service")
 
 asr_service = ASR(
     model_name=os.getenv("ASR_MODEL", "small"),
-    use_gpu=os.getenv("USE_GPU", "true").lower() == "true"
+    use_gpu=os.getenv("USE_GPU", "true").lower() == "true",
+    compute_type=os.getenv("COMPUTE_TYPE"),
+    download_root=os.getenv("WHISPER_CACHE_DIR"),
+    flash_attention=os.getenv("ASR_FLASH_ATTENTION", "false").lower() == "true",
+    beam_size=int(os.getenv("ASR_BEAM_SIZE", "1")),
+    vad_filter=os.getenv("ASR_VAD_FILTER", "true").lower() == "true",
+    num_workers=int(os.getenv("ASR_NUM_WORKERS", "2")),
+    backend=os.getenv("ASR_BACKEND", "faster_whisper"),
+    ov_device=os.getenv("OV_DEVICE", "GPU")
 )
 
 
+@app.on_event("startup")
+async def warmup() -> None:
+    """Warm up the ASR model before serving requests."""
+    try:
+        asr_service.warmup()
+        print("ASR model warmed up")
+    except Exception as e:
+        print(f"ASR warmup failed: {e}")
+
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Uploads up to this size stay in memory; larger ones spill to an anonymous
+# temp file that the OS removes even if the worker dies mid-request.
+SPOOL_MAX_BYTES = int(os.getenv("ASR_SPOOL_MAX_MB", "8")) << 20
+MAX_UPLOAD_BYTES = int(os.getenv("ASR_MAX_UPLOAD_MB", "512")) << 20
+UPLOAD_TOO_LARGE = f"Upload exceeds {MAX_UPLOAD_BYTES >> 20} MB limit"
+
+# Uploads above this size are not hashed or cached
+CACHE_MAX_BYTES = int(os.getenv("ASR_CACHE_MAX_MB", "32")) << 20
+transcription_cache = TranscriptionCache(int(os.getenv("ASR_CACHE_SIZE", "256")))
+
+# Bounds how many transcriptions run at once; excess requests wait here
+# instead of piling onto the model.
+_transcription_slots = asyncio.Semaphore(int(os.getenv("ASR_CONCURRENCY", "4")))
+
+
+async def _run_transcription(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking transcription call in the default thread pool.
+
+    Keeps the event loop free for other requests (such as /health) while the
+    model is busy, and caps concurrency at ASR_CONCURRENCY.
+
+    Args:
+        func: The blocking ASR method to call.
+        *args: Positional arguments passed to ``func``.
+
+    Returns:
+        The return value of ``func``.
+    """
+    async with _transcription_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Reject requests whose declared body size exceeds the upload limit.
+
+    This is only a fast path: bodies sent without a Content-Length (chunked
+    uploads) are checked while they are read.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is None:
+        return await call_next(request)
+    try:
+        declared_size = int(content_length)
+    except ValueError:
+        return JSONResponse(status_code=400, content={"detail": "Invalid Content-Length header"})
+    if declared_size > MAX_UPLOAD_BYTES:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": UPLOAD_TOO_LARGE}
+        )
+    return await call_next(request)
+
+
+def _check_format(file: UploadFile) -> None:
+    """Reject uploads whose extension is not a supported audio format.
+
+    Args:
+        file: The uploaded audio file.
+
+    Raises:
+        HTTPException: If the file format is unsupported.
+    """
+    if not (file.filename or "").lower().endswith(SUPPORTED_FORMATS):
+        raise HTTPException(
+            status_code=400,
+            detail=(f"Unsupported file type: {file.filename}. "
+                    f"Supported formats: {list(SUPPORTED_FORMATS)}")
+        )
+
+
+async def _save_upload(file: UploadFile) -> Tuple[BinaryIO, Optional[str]]:
+    """Stream an uploaded file into a spooled temporary file in fixed-size chunks.
+
+    The content is hashed as it is written so the transcription cache can be
+    consulted without a second pass over the data. The caller must close the
+    returned file.
+
+    Args:
+        file: The uploaded audio file.
+
+    Returns:
+        Tuple of (temporary file rewound to the start, content digest). The
+        digest is None when the upload exceeds ASR_CACHE_MAX_MB.
+
+    Raises:
+        HTTPException: If the upload exceeds ASR_MAX_UPLOAD_MB. Chunked uploads
+            carry no Content-Length, so the middleware cannot reject them early.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    size = 0
+    temp_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            temp_file.close()
+            raise HTTPException(status_code=413, detail=UPLOAD_TOO_LARGE)
+        temp_file.write(chunk)
+        if size <= CACHE_MAX_BYTES:
+            hasher.update(chunk)
+    temp_file.seek(0)
+    digest = hasher.hexdigest() if size <= CACHE_MAX_BYTES else None
+    return temp_file, digest
+
+
+def _digest(data: bytes) -> str:
+    """Compute the cache key for in-memory audio bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 @app.post("/transcribe")
 async def transcribe(file: UploadFile) -> Dict[str, str]:
     """Transcribe an uploaded audio file to text.
@@ -142,23 +544,147 @@ async def transcribe(file: UploadFile) -> Dict[str, str]:
     Raises:
         HTTPException: If the file format is unsupported or transcription fails.
     """
-    if not any(file.filename.endswith(fmt) for fmt in asr_service.get_supported_formats()):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type. Supported formats: {asr_service.get_supported_formats()}"
-        )
+    _check_format(file)
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-        temp_file.write(await file.read())
-        temp_path = temp_file.name
+    temp_file, digest = await _save_upload(file)
 
     try:
-        text = asr_service.transcribe(temp_path)
+        text = transcription_cache.get(digest) if digest else None
+        if text is None:
+            text = await _run_transcription(asr_service.transcribe, temp_file)
+            if digest:
+                transcription_cache.put(digest, text)
         return {"text": text}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
     finally:
-        os.unlink(temp_path)
+        temp_file.close()
+
+
+@app.post("/transcribe_stream")
+async def transcribe_stream(file: UploadFile) -> StreamingResponse:
+    """Transcribe an uploaded audio file, streaming segments as Server-Sent Events.
+
+    Args:
+        file: The uploaded audio file.
+
+    Returns:
+        An ``text/event-stream`` response with one ``data:`` event per segment,
+        or a single event with the whole text on a cache hit.
+
+    Raises:
+        HTTPException: If the file format is unsupported.
+    """
+    _check_format(file)
+
+    temp_file, digest = await _save_upload(file)
+
+    cached = transcription_cache.get(digest) if digest else None
+    if cached is not None:
+        temp_file.close()
+
+        async def cached_event() -> AsyncIterator[str]:
+            yield f"data: {cached}\n\n"
+
+        return StreamingResponse(cached_event(), media_type="text/event-stream")
+
+    async def events() -> AsyncIterator[str]:
+        # Hold a transcription slot for the whole stream, like the other endpoints
+        async with _transcription_slots:
+            loop = asyncio.get_running_loop()
+            segments = asr_service.transcribe_segments(temp_file)
+            texts = []
+            try:
+                while (text := await loop.run_in_executor(None, next, segments, None)) is not None:
+                    texts.append(text)
+                    yield f"data: {text}\n\n"
+            finally:
+                temp_file.close()
+            # Only reached when the stream ran to completion
+            if digest:
+                transcription_cache.put(digest, "".join(texts))
+
+    # Also closes the upload if the client disconnects before the stream starts
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             background=BackgroundTask(temp_file.close))
+
+
+@app.post("/transcribe_raw")
+async def transcribe_raw(request: Request,
+                         sample_rate: int = Query(SAMPLE_RATE, gt=0)) -> Dict[str, str]:
+    """Transcribe raw PCM audio sent as the request body.
+
+    The body must hold mono little-endian float32 samples in [-1, 1]. Decoding
+    happens in memory, skipping the temp file and ffmpeg decode of /transcribe.
+
+    Args:
+        request: The incoming request carrying the PCM bytes.
+        sample_rate: Sample rate of the PCM data; resampled to 16 kHz if different.
+
+    Returns:
+        Dictionary containing the transcribed text.
+
+    Raises:
+        HTTPException: If the body is not valid float32 PCM or transcription fails.
+    """
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=UPLOAD_TOO_LARGE)
+        chunks.append(chunk)
+    body = b"".join(chunks)
+    if not body or len(body) % 4:
+        raise HTTPException(status_code=400, detail="Request body must be float32 PCM samples")
+
+    digest = None
+    if len(body) <= CACHE_MAX_BYTES:
+        loop = asyncio.get_running_loop()
+        digest = f"{sample_rate}:" + await loop.run_in_executor(None, _digest, body)
+        text = transcription_cache.get(digest)
+        if text is not None:
+            return {"text": text}
+
+    audio = np.frombuffer(body, dtype=np.float32)
+
+    try:
+        if sample_rate != SAMPLE_RATE:
+            audio = resample_poly(audio, SAMPLE_RATE, sample_rate).astype(np.float32)
+        text = await _run_transcription(asr_service.transcribe, audio)
+        if digest:
+            transcription_cache.put(digest, text)
+        return {"text": text}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
+@app.post("/transcribe_batch")
+async def transcribe_batch(files: List[UploadFile]) -> Dict[str, List[str]]:
+    """Transcribe several uploaded audio files in one batched pass.
+
+    Args:
+        files: The uploaded audio files.
+
+    Returns:
+        Dictionary containing the transcribed text for each file, in upload order.
+
+    Raises:
+        HTTPException: If a file format is unsupported or transcription fails.
+    """
+    for file in files:
+        _check_format(file)
+
+    uploads = await asyncio.gather(*(_save_upload(file) for file in files))
+    temp_files = [temp_file for temp_file, _ in uploads]
+
+    try:
+        texts = await _run_transcription(asr_service.transcribe_batch, temp_files)
+        return {"texts": texts}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    finally:
+        for temp_file in temp_files:
+            temp_file.close()
 
 
 @app.get("/health")
@@ -172,7 +698,7 @@ async def health() -> Dict[str, bool]:
 
 
 @app.get("/info")
-async def info() -> Dict[str, str]:
+async def info() -> Mapping[str, str]:
     """Get information about the ASR service.
 
     Returns:
@@ -187,8 +713,12 @@ if __name__ == "__main__":
     # Support for consolidated container
     service_type = os.getenv("SERVICE_TYPE", "asr")
     port = int(os.getenv("PORT", "8000"))
+    # Co-located clients can skip TCP loopback by connecting to this socket
+    uds = os.getenv("ASR_UDS")
 
-    if service_type == "asr":
+    if service_type == "asr" and uds:
+        uvicorn.run(app, uds=uds)
+    elif service_type == "asr":
         uvicorn.run(app, host="0.0.0.0", port=port)
     else:
         print(f"ASR service configured but SERVICE_TYPE={service_type}, skipping...")
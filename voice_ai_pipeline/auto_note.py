@@ -16,6 +16,9 @@ Features:
 Usage:
     python -m voice_ai_pipeline.auto_note --audio-file recording.wav
     python -m voice_ai_pipeline.auto_note --record --duration 10
+    python -m voice_ai_pipeline.auto_note --serve
+    python -m voice_ai_pipeline.auto_note --socket /tmp/tts_ai_auto_note.sock \
+        --audio-file recording.wav
 
 Requirements:
     - All dependencies from microphone, summarizer, and onenote_manager components
@@ -23,19 +26,83 @@ Requirements:
     - ASR service running (optional, falls back to local processing)
 """
 
+import asyncio
+import functools
+import glob
+import importlib.util
+import json
+import logging
 import os
+import socket
+import stat
+import struct
 import sys
 import time
 import tempfile
-from typing import Optional, Dict, Any, Tuple
-from pathlib import Path
-from datetime import datetime
+import wave
+from typing import Optional, BinaryIO, Dict, Any, Iterable, Iterator, List, Tuple, Callable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import our components
-from .microphone import MicrophoneRecorder, PYAUDIO_AVAILABLE
-from .summarizer import TextSummarizer, TRANSFORMERS_AVAILABLE
-from .onenote_manager import OneNoteManager, MSGRAPH_AVAILABLE
+# The microphone and OneNote modules import PyAudio and the Graph SDK, so they
+# are only imported once a component actually needs them
+from .summarizer import (TextSummarizer, RemoteSummarizer, SummarizationConfig, SummaryCache,
+                         TRANSFORMERS_AVAILABLE)
 from .local_notes import LocalNoteManager
+from ._fast_audio import speech_bounds
+
+T = TypeVar("T")
+# Receives progress events ({'event': ..., ...}) while a recording is processed
+EventCallback = Callable[[Dict[str, Any]], None]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "tts_ai_auto_note.sock")
+
+# Streamed transcriptions start a background partial summary every this many transcribed words
+STREAM_SUMMARY_WORDS = 400
+
+# Extensions picked up when a directory is passed as --audio-file
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".m4a", ".ogg", ".webm")
+
+# Failures a pipeline stage reports and recovers from; anything else is a bug
+# and propagates with its traceback
+STAGE_ERRORS = (OSError, requests.RequestException, KeyError)
+# Model backends also raise RuntimeError/ValueError (e.g. out of memory, bad input)
+SUMMARIZER_ERRORS = STAGE_ERRORS + (RuntimeError, ValueError)
+
+
+class AutoNoteError(Exception):
+    """Raised by pipeline stages when a recording cannot be processed."""
+
+
+def _log_done(results: Dict[str, Any]):
+    """Log one structured line for a finished recording, with texts reduced to their lengths."""
+    if logger.isEnabledFor(logging.INFO):
+        record = {key: len(value) if key in ('transcription', 'summary') and value else value
+                  for key, value in results.items()}
+        logger.info("done: %s", json.dumps(record, default=str))
+
+
+def _probe(*modules: str) -> bool:
+    """Check that modules are installed without importing them."""
+    try:
+        return all(importlib.util.find_spec(module) is not None for module in modules)
+    except (ImportError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=4)
+def _get_summarizer(model_size: str, dtype: str = "fp32", compile_model: bool = False,
+                    runtime: str = "torch") -> TextSummarizer:
+    """Load a summarizer once per model size and precision and share it between processors."""
+    return TextSummarizer(**SummarizationConfig.get_model_config(model_size), dtype=dtype,
+                          compile_model=compile_model, runtime=runtime)
 
 
 class AutoNoteProcessor:
@@ -46,7 +113,14 @@ class AutoNoteProcessor:
                  onenote_tenant_id: Optional[str] = None,
                  onenote_client_secret: Optional[str] = None,
                  summarizer_model: str = "medium",
-                 note_storage: str = "auto"):
+                 note_storage: str = "auto",
+                 summarizer_backend: str = "local",
+                 summarizer_url: Optional[str] = None,
+                 summarizer_dtype: str = "fp32",
+                 summarizer_compile: bool = False,
+                 summarizer_runtime: str = "torch",
+                 asr_socket: Optional[str] = None,
+                 local_notes_dir: Optional[str] = None):
         """
         Initialize the auto-note processor.
 
@@ -56,9 +130,23 @@ class AutoNoteProcessor:
             onenote_tenant_id: Azure tenant ID
             onenote_client_secret: Azure app client secret
             summarizer_model: Size of summarization model ('small', 'medium', 'large')
-            note_storage: Note storage method ('auto', 'onenote', 'local')
+            note_storage: Note storage method ('auto', 'onenote', 'local', or 'none'
+                to skip note storage entirely)
+            summarizer_backend: Where summarization runs: 'local' (in-process
+                transformers), 'tgi' (Text Generation Inference) or 'vllm'
+            summarizer_url: Base URL of the generation server for 'tgi'/'vllm';
+                ``summarizer_model`` is sent as the model name for 'vllm'
+            summarizer_dtype: Local summarizer weight precision
+                ('fp32', 'bf16', 'fp16', 'int8', 'auto')
+            summarizer_compile: Compile the local summarizer with torch.compile (GPU only)
+            summarizer_runtime: Local summarizer runtime ('torch' or 'onnx')
+            asr_socket: Unix socket of a co-located ASR service, used instead
+                of TCP for requests to ``asr_url``
+            local_notes_dir: Directory for local notes (default: ~/tts_ai_notes)
         """
         self.asr_url = asr_url
+        self.asr_socket = asr_socket
+        self.local_notes_dir = local_notes_dir
         self.note_storage = note_storage
         self.onenote_config = {
             'client_id': onenote_client_id,
@@ -66,69 +154,110 @@ class AutoNoteProcessor:
             'client_secret': onenote_client_secret
         }
         self.summarizer_model = summarizer_model
+        self.summarizer_backend = summarizer_backend
+        self.summarizer_url = summarizer_url
+        self.summarizer_dtype = summarizer_dtype
+        self.summarizer_compile = summarizer_compile
+        self.summarizer_runtime = summarizer_runtime
 
         # Initialize components
         self.microphone = None
         self.summarizer = None
         self.onenote = None
         self.local_notes = None
+        # Summaries made with other models or lengths must not be reused
+        summary_config = SummarizationConfig.get_model_config(summarizer_model)
+        self.summary_cache = SummaryCache(namespace='|'.join(map(str, (
+            summarizer_backend, summarizer_url or '', summarizer_model,
+            summary_config['model_name'], summary_config['max_length'],
+            summary_config['min_length']))))
+
+        # One pooled session shared by the ASR client and Graph calls.
+        # urllib3 does not retry POSTs by default, so only idempotent calls are retried.
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+        ))
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
 
         self._check_dependencies()
         self._initialize_components()
 
     def _check_dependencies(self):
         """Check if all required dependencies are available."""
-        missing_deps = []
+        missing_deps: set[str] = set()
 
-        if not PYAUDIO_AVAILABLE:
-            missing_deps.append("PyAudio (for microphone recording)")
+        if not _probe('pyaudio'):
+            missing_deps.add("PyAudio (for microphone recording)")
 
-        if not TRANSFORMERS_AVAILABLE:
-            missing_deps.append("Transformers (for text summarization)")
+        if self.summarizer_backend == 'local' and not TRANSFORMERS_AVAILABLE:
+            missing_deps.add("Transformers (for text summarization)")
 
         # Check note storage dependencies
-        if self.note_storage in ['auto', 'onenote'] and not MSGRAPH_AVAILABLE:
+        if self.note_storage in ['auto', 'onenote'] and not _probe('msgraph', 'azure.identity'):
             if self.note_storage == 'onenote':
-                missing_deps.append("Microsoft Graph SDK (for OneNote)")
+                missing_deps.add("Microsoft Graph SDK (for OneNote)")
             elif self.note_storage == 'auto':
                 print("⚠️  Microsoft Graph SDK not available, will use local notes")
 
         if missing_deps:
-            print("⚠️  Missing optional dependencies:")
-            for dep in missing_deps:
-                print(f"   - {dep}")
-            print("\n📦 Install all dependencies:")
-            print("   pip install -r requirements_test.txt")
-            print("\n🔧 For PyAudio on Ubuntu:")
-            print("   sudo apt-get install portaudio19-dev python3-pyaudio")
-            print("   pip install pyaudio")
-            print("   pip install pyaudio")
+            lines = ["⚠️  Missing optional dependencies:"]
+            lines += [f"   - {dep}" for dep in sorted(missing_deps)]
+            lines += ["\n📦 Install all dependencies:", "   pip install -r requirements_test.txt"]
+            if "PyAudio (for microphone recording)" in missing_deps:
+                lines += ["\n🔧 For PyAudio on Ubuntu:",
+                          "   sudo apt-get install portaudio19-dev python3-pyaudio",
+                          "   pip install pyaudio"]
+            print("\n".join(lines))
 
     def _initialize_components(self):
         """Initialize all components."""
         try:
             # Initialize microphone (optional)
-            if PYAUDIO_AVAILABLE:
-                self.microphone = MicrophoneRecorder(self.asr_url)
+            if _probe('pyaudio'):
+                from .microphone import MicrophoneRecorder
+                self.microphone = MicrophoneRecorder(self.asr_url, session=self.http,
+                                                     asr_socket=self.asr_socket)
                 print("🎤 Microphone component initialized")
             else:
                 print("⚠️  Microphone component not available")
 
             # Initialize summarizer (optional)
-            if TRANSFORMERS_AVAILABLE:
-                from .summarizer import SummarizationConfig
+            if self.summarizer_backend != 'local':
+                if not self.summarizer_url:
+                    raise ValueError(f"Summarizer backend '{self.summarizer_backend}' "
+                                     "requires a summarizer URL")
                 config = SummarizationConfig.get_model_config(self.summarizer_model)
-                self.summarizer = TextSummarizer(**config)
+                self.summarizer = RemoteSummarizer(
+                    self.summarizer_url,
+                    backend=self.summarizer_backend,
+                    model_name=self.summarizer_model,
+                    max_length=config['max_length'],
+                    session=self.http
+                )
+                print(f"🤖 Summarizer component initialized "
+                      f"({self.summarizer_backend} at {self.summarizer_url})")
+            elif TRANSFORMERS_AVAILABLE:
+                self.summarizer = _get_summarizer(self.summarizer_model, self.summarizer_dtype,
+                                                  self.summarizer_compile, self.summarizer_runtime)
                 print("🤖 Summarizer component initialized")
             else:
                 print("⚠️  Summarizer component not available")
 
             # Initialize note storage
-            if self.note_storage == 'onenote' and MSGRAPH_AVAILABLE and self.onenote_config['client_id']:
-                self.onenote = OneNoteManager(**self.onenote_config)
+            if self.note_storage == 'none':
+                return
+            msgraph_available = self.note_storage != 'local' and _probe('msgraph', 'azure.identity')
+            onenote_ready = msgraph_available and self.onenote_config['client_id']
+            if self.note_storage == 'onenote' and onenote_ready:
+                from .onenote_manager import OneNoteManager
+                self.onenote = OneNoteManager(**self.onenote_config, session=self.http)
                 print("📓 OneNote component initialized")
-            elif self.note_storage == 'local' or (self.note_storage == 'auto' and not (MSGRAPH_AVAILABLE and self.onenote_config['client_id'])):
-                self.local_notes = LocalNoteManager()
+            elif self.note_storage == 'local' or (self.note_storage == 'auto'
+                                                  and not onenote_ready):
+                self.local_notes = (LocalNoteManager(base_dir=self.local_notes_dir)
+                                    if self.local_notes_dir else LocalNoteManager())
                 print("📁 Local notes component initialized")
                 if self.note_storage == 'auto':
                     print("   (Using local notes as fallback)")
@@ -141,14 +270,41 @@ class AutoNoteProcessor:
             print(f"❌ Failed to initialize components: {e}")
 
     def process_audio_file(self, audio_file: str, title: Optional[str] = None,
-                          create_note: bool = True) -> Dict[str, Any]:
+                           create_note: bool = True,
+                           on_event: Optional[EventCallback] = None) -> Dict[str, Any]:
         """
         Process an audio file: transcribe, summarize, and create OneNote.
 
+        Synchronous entry point for :meth:`process_audio_file_async`.
+
+        Args:
+            audio_file: Path to audio file
+            title: Custom title for the note
+            create_note: Whether to create OneNote entry
+            on_event: Optional callback for ``{'type': 'partial', 'text': ...}`` events
+
+        Returns:
+            Processing results dictionary
+        """
+        return asyncio.run(self.process_audio_file_async(audio_file, title, create_note, on_event))
+
+    async def process_audio_file_async(self, audio_file: str, title: Optional[str] = None,
+                                       create_note: bool = True,
+                                       on_event: Optional[EventCallback] = None) -> Dict[str, Any]:
+        """
+        Process an audio file with independent stages overlapped.
+
+        Transcription is streamed from the ASR service segment by segment, and
+        summarization of the first windows starts while later segments are
+        still being decoded. Metadata extraction runs alongside both. Blocking
+        calls (ASR HTTP request, summarizer model, Graph SDK) run in threads.
+
         Args:
             audio_file: Path to audio file
             title: Custom title for the note
             create_note: Whether to create OneNote entry
+            on_event: Optional callback, invoked from a worker thread with a
+                ``{'type': 'partial', 'text': ...}`` event per transcribed segment
 
         Returns:
             Processing results dictionary
@@ -162,57 +318,219 @@ class AutoNoteProcessor:
             'error': None
         }
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        metadata_task = asyncio.create_task(
+            self._run_blocking(self._get_audio_metadata, audio_file))
 
         try:
-            # Step 1: Transcribe audio
-            print(f"🎵 Processing audio file: {audio_file}")
-            transcription = self._transcribe_audio_file(audio_file)
+            # Transcribe and summarize as a pipeline while metadata extraction runs
+            logger.info("🎵 Processing audio file: %s", audio_file)
+            transcription, summary = await self._run_blocking(
+                self._transcribe_and_summarize, self._transcribe_audio_file(audio_file), on_event
+            )
 
             if not transcription:
-                results['error'] = "Failed to transcribe audio"
-                return results
+                raise AutoNoteError("Failed to transcribe audio")
 
             results['transcription'] = transcription
-            print(f"📝 Transcription complete ({len(transcription)} characters)")
-
-            # Step 2: Summarize transcription
-            summary = self._summarize_text(transcription)
             results['summary'] = summary
+            logger.debug("📝 Transcription complete (%d characters)", len(transcription))
+            metadata = await metadata_task
 
             if summary:
-                print(f"📋 Summary generated ({len(summary)} characters)")
+                logger.debug("📋 Summary generated (%d characters)", len(summary))
             else:
-                print("⚠️  Summary generation failed, using truncated transcription")
+                logger.warning("⚠️  Summary generation failed, using truncated transcription")
                 results['summary'] = transcription[:500] + "..." if len(transcription) > 500 else transcription
 
             # Create OneNote (if enabled)
             if create_note and (self.onenote or self.local_notes):
-                note_created = self._create_note(title, transcription, summary, audio_file)
+                note_created = await self._run_blocking(
+                    self._create_note, title, transcription, summary, audio_file, metadata
+                )
                 results['note_created'] = note_created
 
                 if note_created:
                     storage_type = "OneNote" if self.onenote else "local file"
-                    print(f"✅ Note created successfully in {storage_type}")
+                    logger.debug("✅ Note created successfully in %s", storage_type)
                 else:
-                    print("❌ Failed to create note")
+                    logger.error("❌ Failed to create note")
             elif create_note and not (self.onenote or self.local_notes):
-                print("⚠️  No note storage configured, skipping note creation")
+                logger.warning("⚠️  No note storage configured, skipping note creation")
 
             results['success'] = True
-            results['processing_time'] = time.time() - start_time
-
-            print(f"⏱️  Processing time: {results['processing_time']:.2f} seconds")
-        except Exception as e:
+            results['processing_time'] = (time.perf_counter_ns() - start_ns) / 1e9
+        except AutoNoteError as e:
             results['error'] = str(e)
-            results['processing_time'] = time.time() - start_time
-            print(f"❌ Processing failed: {e}")
+            results['processing_time'] = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.error("❌ Processing failed: %s", e)
+        finally:
+            metadata_task.cancel()
 
+        _log_done(results)
         return results
 
+    def process_audio_files(self, audio_files: List[str],
+                            create_note: bool = True) -> List[Dict[str, Any]]:
+        """
+        Process several audio files, batching each stage across all files.
+
+        Synchronous entry point for :meth:`process_audio_files_async`.
+
+        Args:
+            audio_files: Paths to audio files
+            create_note: Whether to create a note per file
+
+        Returns:
+            Processing results dictionary for each file, in input order
+        """
+        return asyncio.run(self.process_audio_files_async(audio_files, create_note))
+
+    async def process_audio_files_async(self, audio_files: List[str],
+                                        create_note: bool = True) -> List[Dict[str, Any]]:
+        """
+        Process several audio files grouped by stage.
+
+        All files go to the ASR service in one batch request and through the
+        summarizer as one padded batch, so each model is warmed once per call
+        rather than once per file. Metadata is extracted concurrently.
+
+        Args:
+            audio_files: Paths to audio files
+            create_note: Whether to create a note per file
+
+        Returns:
+            Processing results dictionary for each file, in input order
+        """
+        start_ns = time.perf_counter_ns()
+        all_results = [{
+            'success': False,
+            'transcription': None,
+            'summary': None,
+            'note_created': False,
+            'processing_time': 0,
+            'error': None
+        } for _ in audio_files]
+
+        metadata_task = asyncio.ensure_future(
+            self._run_blocking(self._get_audio_metadata_many, audio_files))
+
+        try:
+            logger.info("🎵 Processing %d audio files", len(audio_files))
+            transcriptions = await self._run_blocking(self._transcribe_audio_files, audio_files)
+
+            done = [i for i, text in enumerate(transcriptions) if text]
+            for text, results in zip(transcriptions, all_results):
+                if not text:
+                    results['error'] = "Failed to transcribe audio"
+
+            summaries, metadata = await asyncio.gather(
+                self._run_blocking(self._summarize_texts, [transcriptions[i] for i in done]),
+                metadata_task
+            )
+
+            for i, summary in zip(done, summaries):
+                transcription = transcriptions[i]
+                results = all_results[i]
+                results['transcription'] = transcription
+                results['summary'] = summary or (transcription[:500] + "..."
+                                                 if len(transcription) > 500 else transcription)
+                results['success'] = True
+
+            if create_note and self.onenote:
+                # One Graph $batch round-trip per 20 notes
+                entries = [{
+                    'transcription': all_results[i]['transcription'],
+                    'summary': all_results[i]['summary'],
+                    'metadata': metadata[i]
+                } for i in done]
+                created = await self._run_blocking(
+                    self.onenote.create_transcription_notes_batch, entries)
+                for i, note_created in zip(done, created):
+                    all_results[i]['note_created'] = note_created
+            elif create_note and self.local_notes:
+                # One timestamp for the whole batch, numbered like the OneNote batch titles
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                for n, i in enumerate(done, 1):
+                    results = all_results[i]
+                    results['note_created'] = await self._run_blocking(
+                        self._create_note, f"AI Note {timestamp}_{n}", results['transcription'],
+                        results['summary'], audio_files[i], metadata[i]
+                    )
+
+        except AutoNoteError as e:
+            logger.error("❌ Batch processing failed: %s", e)
+            for results in all_results:
+                if not results['success']:
+                    results['error'] = results['error'] or str(e)
+        finally:
+            metadata_task.cancel()
+
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        for results in all_results:
+            results['processing_time'] = processing_time
+            _log_done(results)
+
+        return all_results
+
+    async def serve(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        """
+        Serve processing jobs over a Unix socket, keeping all models loaded.
+
+        Clients send one JSON request per line, e.g.
+        ``{"op": "process_audio_file", "audio_file": "a.wav"}`` or
+        ``{"op": "process_audio_files", "audio_files": ["a.wav", "b.wav"]}``,
+        and receive one JSON result line per request. Jobs run one at a time.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+
+        Raises:
+            FileExistsError: If the path is not a socket, or another daemon
+                is already listening on it
+        """
+        job_lock = asyncio.Lock()
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                while line := await reader.readline():
+                    try:
+                        request = json.loads(line)
+                        async with job_lock:
+                            response = await self._dispatch(request)
+                    except Exception as e:
+                        response = {'success': False, 'error': str(e)}
+                    writer.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+                    await writer.drain()
+            finally:
+                writer.close()
+
+        _remove_stale_socket(socket_path)
+        server = await asyncio.start_unix_server(handle, path=socket_path)
+        print(f"🛰️  Auto-note daemon listening on {socket_path}")
+        async with server:
+            await server.serve_forever()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Any:
+        """Run one daemon request and return its JSON-serializable result."""
+        op = request.get('op')
+        create_note = request.get('create_note', True)
+        if op == 'process_audio_file':
+            return await self.process_audio_file_async(request['audio_file'], request.get('title'),
+                                                       create_note)
+        if op == 'process_audio_files':
+            return await self.process_audio_files_async(request['audio_files'], create_note)
+        raise ValueError(f"Unknown op: {op}")
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking stage in the default thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
     def process_live_recording(self, duration: float = 10.0,
-                              title: Optional[str] = None,
-                              create_note: bool = True) -> Dict[str, Any]:
+                               title: Optional[str] = None,
+                               create_note: bool = True,
+                               save_wav: Optional[str] = None) -> Dict[str, Any]:
         """
         Record live audio and process it.
 
@@ -220,6 +538,7 @@ class AutoNoteProcessor:
             duration: Recording duration in seconds
             title: Custom title for the note
             create_note: Whether to create OneNote entry
+            save_wav: Optional path to also save the recording as a WAV file
 
         Returns:
             Processing results dictionary
@@ -239,80 +558,173 @@ class AutoNoteProcessor:
             'error': None
         }
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Record and transcribe in one step
-            print(f"🎤 Recording for {duration} seconds...")
-            transcription = self.microphone.record_and_transcribe(duration=duration)
-
+            # Transcribe while recording, summarizing in the background so
+            # little work remains once recording stops
+            logger.info("🎤 Recording for %s seconds...", duration)
+            transcription, summary = self._transcribe_and_summarize(
+                self.microphone.stream_transcribe(duration=duration)
+            )
             if not transcription:
-                results['error'] = "Failed to record or transcribe audio"
-                return results
+                raise AutoNoteError("Failed to record or transcribe audio")
 
             results['transcription'] = transcription
-            print(f"📝 Live transcription complete ({len(transcription)} characters)")
-
-            # Summarize
-            summary = self._summarize_text(transcription)
+            logger.debug("📝 Live transcription complete (%d characters)", len(transcription))
             results['summary'] = summary or transcription[:500] + "..."
 
-            # Create note
-            if create_note and (self.onenote or self.local_notes):
-                # Save temporary audio file for metadata (needed for both storage types)
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                    temp_filename = temp_file.name
-
-                try:
-                    if self.microphone.save_recording(temp_filename):
-                        note_created = self._create_note(title, transcription, summary, temp_filename)
-                        results['note_created'] = note_created
-                        if note_created:
-                            storage_type = "OneNote" if self.onenote else "local file"
-                            print(f"✅ Note created successfully in {storage_type}")
-                    else:
-                        results['note_created'] = False
-                        print("❌ Failed to save temporary audio file")
-                finally:
-                    if os.path.exists(temp_filename):
-                        os.unlink(temp_filename)
-            elif create_note and not (self.onenote or self.local_notes):
-                print("⚠️  No note storage configured, skipping note creation")
+            # Write the WAV on a thread while the note is created; neither
+            # depends on the other since metadata comes from the in-memory recording
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                wav_saved = (pool.submit(self.microphone.save_recording, save_wav)
+                             if save_wav else None)
+
+                if create_note and (self.onenote or self.local_notes):
+                    metadata = self.microphone.get_recording_metadata()
+                    note_created = self._create_note(title, transcription, summary,
+                                                     metadata=metadata)
+                    results['note_created'] = note_created
+                    if note_created:
+                        storage_type = "OneNote" if self.onenote else "local file"
+                        logger.debug("✅ Note created successfully in %s", storage_type)
+                elif create_note and not (self.onenote or self.local_notes):
+                    logger.warning("⚠️  No note storage configured, skipping note creation")
+
+            if wav_saved is not None and not wav_saved.result():
+                raise AutoNoteError(f"Failed to save recording to {save_wav}")
 
             results['success'] = True
-            results['processing_time'] = time.time() - start_time
+            results['processing_time'] = (time.perf_counter_ns() - start_ns) / 1e9
 
-        except Exception as e:
+        except AutoNoteError as e:
             results['error'] = str(e)
-            results['processing_time'] = time.time() - start_time
+            results['processing_time'] = (time.perf_counter_ns() - start_ns) / 1e9
 
+        _log_done(results)
         return results
 
-    def _transcribe_audio_file(self, audio_file: str) -> Optional[str]:
-        """Transcribe audio file using ASR service."""
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counts and size of the summary cache."""
+        return self.summary_cache.stats()
+
+    def clear_cache(self):
+        """Drop all cached summaries."""
+        self.summary_cache.clear()
+
+    def _transcribe_audio_file(self, audio_file: str) -> Iterator[str]:
+        """Transcribe audio file using ASR service, yielding segments as they are decoded."""
         if not self.microphone:
-            return None
+            return
 
         try:
-            return self.microphone.transcribe_recording(audio_file)
-        except Exception as e:
+            yield from self.microphone.transcribe_recording_stream(audio_file)
+        except STAGE_ERRORS as e:
             print(f"❌ Transcription failed: {e}")
-            return None
+
+    def _transcribe_and_summarize(self, segments: Iterable[str],
+                                  on_event: Optional[EventCallback] = None
+                                  ) -> Tuple[str, Optional[str]]:
+        """
+        Consume transcribed segments, summarizing rolling windows as they fill.
+
+        Every ``STREAM_SUMMARY_WORDS`` words are summarized on a background
+        thread while more segments arrive; the partial summaries are merged
+        at the end. Short transcriptions are summarized in one go.
+
+        Args:
+            segments: Transcribed segment texts, in order
+            on_event: Optional callback for ``{'type': 'partial', 'text': ...}`` events
+
+        Returns:
+            Tuple of (full transcription, summary or None)
+        """
+        parts, pending, partial_summaries = [], [], []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for text in segments:
+                parts.append(text)
+                pending.append(text)
+                if on_event:
+                    on_event({'type': 'partial', 'text': text})
+                if sum(len(part.split()) for part in pending) >= STREAM_SUMMARY_WORDS:
+                    partial_summaries.append(pool.submit(self._summarize_text, ' '.join(pending)))
+                    pending = []
+
+            transcription = ' '.join(parts)
+            if not transcription:
+                return transcription, None
+
+            # Merge the partial summaries, or summarize directly if short
+            if partial_summaries:
+                if pending:
+                    partial_summaries.append(pool.submit(self._summarize_text, ' '.join(pending)))
+                partials = [summary for summary in (f.result() for f in partial_summaries)
+                            if summary]
+                if len(partials) > 1:
+                    summary = self._summarize_text(' '.join(partials))
+                else:
+                    summary = next(iter(partials), None)
+            else:
+                summary = self._summarize_text(transcription)
+        return transcription, summary
+
+    def _transcribe_audio_files(self, audio_files: List[str]) -> List[Optional[str]]:
+        """Transcribe several audio files with one ASR batch request."""
+        if not self.microphone:
+            return [None] * len(audio_files)
+
+        try:
+            return self.microphone.transcribe_batch(audio_files)
+        except STAGE_ERRORS as e:
+            raise AutoNoteError(f"Batch transcription failed: {e}") from e
+
+    def _summarize_texts(self, texts: List[str]) -> List[Optional[str]]:
+        """Summarize several texts in one batch, skipping cached ones."""
+        if not self.summarizer:
+            return [None] * len(texts)
+
+        summaries = [self.summary_cache.get(text) for text in texts]
+        misses = [i for i, summary in enumerate(summaries) if summary is None]
+        if not misses:
+            return summaries
+
+        try:
+            generated = self.summarizer.batch_summarize([texts[i] for i in misses])
+        except SUMMARIZER_ERRORS as e:
+            print(f"❌ Summarization failed: {e}")
+            return summaries
+
+        for i, summary in zip(misses, generated):
+            summaries[i] = summary
+        self.summary_cache.put_many([(texts[i], summaries[i]) for i in misses])
+        return summaries
 
     def _summarize_text(self, text: str) -> Optional[str]:
         """Summarize text using summarizer component."""
         if not self.summarizer:
             return None
 
+        cached = self.summary_cache.get(text)
+        if cached is not None:
+            print("📋 Reusing cached summary")
+            return cached
+
         try:
-            return self.summarizer.summarize(text)
-        except Exception as e:
+            summary = self.summarizer.summarize(text)
+            self.summary_cache.put(text, summary)
+            return summary
+        except SUMMARIZER_ERRORS as e:
             print(f"❌ Summarization failed: {e}")
             return None
 
     def _create_note(self, title: Optional[str], transcription: str,
-                    summary: Optional[str], audio_file: str) -> bool:
-        """Create a note using the configured storage method."""
+                     summary: Optional[str], audio_file: Optional[str] = None,
+                     metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Create a note using the configured storage method.
+
+        ``metadata`` may be passed in when it was already extracted; otherwise
+        it is read from ``audio_file``.
+        """
         if not self.onenote and not self.local_notes:
             print("❌ No note storage available")
             return False
@@ -320,7 +732,7 @@ class AutoNoteProcessor:
         try:
             # Generate title if not provided
             if not title:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 title = f"AI Note {timestamp}"
 
             # Ensure summary is not None
@@ -328,7 +740,8 @@ class AutoNoteProcessor:
                 summary = transcription[:500] + "..." if len(transcription) > 500 else transcription
 
             # Get audio file metadata
-            metadata = self._get_audio_metadata(audio_file)
+            if metadata is None:
+                metadata = self._get_audio_metadata(audio_file) if audio_file else {}
 
             # Create note based on storage method
             if self.onenote:
@@ -350,136 +763,355 @@ class AutoNoteProcessor:
             else:
                 return False
 
-        except Exception as e:
+        except STAGE_ERRORS as e:
             print(f"❌ Failed to create note: {e}")
             return False
 
+    def _get_audio_metadata_many(self, audio_files: List[str]) -> List[Dict[str, Any]]:
+        """Extract metadata for several files, fanning the stat/header reads out to threads."""
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            return list(pool.map(self._get_audio_metadata, audio_files))
+
     def _get_audio_metadata(self, audio_file: str) -> Dict[str, Any]:
         """Extract metadata from audio file."""
         metadata = {}
 
         try:
-            # Get file size
-            file_size = os.path.getsize(audio_file)
-            metadata['file_size_bytes'] = file_size
-            metadata['file_size_mb'] = round(file_size / (1024 * 1024), 2)
-
-            # Get file modification time
-            mod_time = os.path.getmtime(audio_file)
-            metadata['created_timestamp'] = datetime.fromtimestamp(mod_time).isoformat()
-
-            # Try to get audio duration (if wave file)
-            if audio_file.lower().endswith('.wav'):
-                try:
-                    import wave
-                    with wave.open(audio_file, 'rb') as wf:
-                        frames = wf.getnframes()
-                        rate = wf.getframerate()
-                        duration = frames / float(rate)
+            # One open serves the stat, the header read and the sample mapping
+            with open(audio_file, 'rb') as f:
+                # Get file size and modification time
+                file_stat = os.fstat(f.fileno())
+                metadata['file_size_bytes'] = file_stat.st_size
+                metadata['file_size_mb'] = round(file_stat.st_size / (1024 * 1024), 2)
+                metadata['created_timestamp'] = time.strftime("%Y-%m-%dT%H:%M:%S",
+                                                              time.localtime(file_stat.st_mtime))
+
+                # Try to get audio duration (if wave file)
+                if audio_file.lower().endswith('.wav'):
+                    header = self._wav_header(f)
+                    duration = self._wav_duration(audio_file, header)
+                    if duration is not None:
                         metadata['duration_seconds'] = round(duration, 2)
-                except:
-                    pass
+                    speech_duration = self._wav_speech_duration(f, header)
+                    if speech_duration is not None:
+                        metadata['speech_duration_seconds'] = round(speech_duration, 2)
 
-        except Exception as e:
+        except OSError as e:
             print(f"⚠️  Failed to extract audio metadata: {e}")
 
         return metadata
 
+    def _wav_header(self, f: BinaryIO) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Parse the canonical 44-byte WAV header with a single read.
+
+        Args:
+            f: WAV file opened in binary mode, positioned at the start
+
+        Returns:
+            Tuple of (channels, sample_rate, bits_per_sample, data_size), or
+            None if the file has extra chunks before 'data'
+        """
+        header = f.read(44)
+        if not (len(header) == 44 and header[:4] == b'RIFF' and header[8:12] == b'WAVE'
+                and header[12:16] == b'fmt ' and header[36:40] == b'data'):
+            return None
+        channels, rate, _, _, bits = struct.unpack_from('<HIIHH', header, 22)
+        return channels, rate, bits, struct.unpack_from('<I', header, 40)[0]
+
+    def _wav_duration(self, audio_file: str,
+                      header: Optional[Tuple[int, int, int, int]]) -> Optional[float]:
+        """Compute a WAV file's duration from its parsed header."""
+        try:
+            if header:
+                channels, rate, bits, data_size = header
+                return data_size / (channels * rate * bits // 8)
+
+            # Non-canonical layout (extra chunks before 'data'): let wave walk the chunks
+            with wave.open(audio_file, 'rb') as wf:
+                return wf.getnframes() / float(wf.getframerate())
+        except (OSError, EOFError, wave.Error, ZeroDivisionError) as e:
+            logger.debug("Could not read WAV duration of %s: %s", audio_file, e)
+            return None
+
+    def _wav_speech_duration(self, f: BinaryIO,
+                             header: Optional[Tuple[int, int, int, int]]) -> Optional[float]:
+        """Measure the span between the first and last non-silent samples of a 16-bit WAV."""
+        if not header or header[2] != 16:
+            return None
+        channels, rate, _, data_size = header
+        try:
+            # Map the samples instead of reading them into memory
+            pcm = np.memmap(f, dtype='<i2', mode='r', offset=44, shape=(data_size // 2,))
+            start, end = speech_bounds(pcm)
+            return (end - start) / (channels * rate)
+        except (OSError, ValueError, ZeroDivisionError) as e:
+            logger.debug("Could not measure speech duration of %s: %s", f.name, e)
+            return None
+
+
+def _remove_stale_socket(socket_path: str):
+    """
+    Remove a socket file left behind by a daemon that is no longer running.
+
+    Args:
+        socket_path: Path the daemon is about to listen on
+
+    Raises:
+        FileExistsError: If the path is not a socket, or a daemon still accepts
+            connections on it
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+        else:
+            raise FileExistsError(f"An auto-note daemon is already listening on {socket_path}")
+    os.unlink(socket_path)
+
+
+def expand_audio_paths(paths: List[str]) -> List[str]:
+    """
+    Expand directories and glob patterns in ``paths`` into audio files.
+
+    Directories are listed with ``os.scandir`` (not recursively). Quoted
+    glob patterns such as ``'recordings/*.wav'`` are expanded here, so they
+    work where the shell does not expand them. Other paths are kept as given.
+
+    Args:
+        paths: Audio file and directory paths
+
+    Returns:
+        Audio file paths, with each directory's files sorted by name. A file
+        reached through more than one input is listed once, at its first position
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                files.extend(sorted(
+                    entry.path for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(AUDIO_EXTENSIONS)
+                ))
+        elif glob.has_magic(path):
+            # Duplicates with other inputs are dropped below; matched directories are skipped
+            files.extend(sorted(match for match in glob.glob(path) if os.path.isfile(match)))
+        else:
+            files.append(path)
+    # Overlapping inputs (a directory and a file inside it) would be processed twice
+    unique = {}
+    for file in files:
+        unique.setdefault(os.path.realpath(file), file)
+    return list(unique.values())
+
+
+def submit_job(request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET_PATH) -> Any:
+    """
+    Submit a job to a running auto-note daemon and wait for its result.
+
+    Args:
+        request: Request dictionary (see :meth:`AutoNoteProcessor.serve`)
+        socket_path: Path of the daemon's Unix socket
+
+    Returns:
+        The decoded JSON result
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            return json.loads(f.readline())
+
 
 def main():
     """Command-line interface for auto-note processing."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Auto-Note Processor for TTS AI Pipeline")
-    parser.add_argument('--audio-file', help='Path to audio file to process')
+    parser.add_argument('--audio-file', nargs='+',
+                        help='Path(s) or glob patterns of audio files to process; '
+                             'directories are expanded to the audio files they contain')
     parser.add_argument('--record', action='store_true', help='Record live audio')
     parser.add_argument('--duration', type=float, default=10.0, help='Recording duration in seconds')
     parser.add_argument('--title', help='Custom title for the note')
+    parser.add_argument('--save-wav',
+                        help='With --record, also save the recording to this WAV file')
     parser.add_argument('--no-note', action='store_true', help='Skip OneNote creation')
     parser.add_argument('--asr-url', default='http://localhost:8000', help='ASR service URL')
+    parser.add_argument('--asr-socket', default=os.getenv('ASR_SOCKET'),
+                        help='Unix socket of a co-located ASR service (env: ASR_SOCKET)')
     parser.add_argument('--onenote-client-id', help='Azure app client ID')
     parser.add_argument('--onenote-tenant-id', help='Azure tenant ID')
     parser.add_argument('--onenote-client-secret', help='Azure app client secret')
-    parser.add_argument('--summarizer-model', default='medium', choices=['small', 'medium', 'large'],
-                       help='Summarization model size')
+    parser.add_argument('--summarizer-model', default='medium',
+                        help="Summarization model size ('small', 'medium', 'large'), "
+                             "or the served model name for vllm")
+    parser.add_argument('--summarizer-backend', default='local', choices=['local', 'tgi', 'vllm'],
+                        help='Run summarization in-process or on a text-generation server')
+    parser.add_argument('--summarizer-url', help='Base URL of the tgi/vllm summarization server')
+    parser.add_argument('--summarizer-dtype', default='fp32',
+                        choices=['fp32', 'bf16', 'fp16', 'int8', 'auto'],
+                        help="Local summarizer weight precision "
+                             "(fp16 is GPU only, int8 CPU only; 'auto' picks per device)")
+    parser.add_argument('--summarizer-compile', action='store_true',
+                        help='Compile the local summarizer with torch.compile '
+                             'and CUDA graphs (GPU only)')
+    parser.add_argument('--summarizer-runtime', default='torch', choices=['torch', 'onnx'],
+                        help='Local summarizer runtime (onnx requires optimum and onnxruntime)')
     parser.add_argument('--note-storage', default='auto', choices=['auto', 'onenote', 'local'],
-                       help='Note storage method (auto=prefer OneNote, fallback to local)')
+                        help='Note storage method (auto=prefer OneNote, fallback to local)')
     parser.add_argument('--local-notes-dir', help='Directory for local notes (default: ~/tts_ai_notes)')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a daemon that keeps models loaded '
+                             'and accepts jobs on --socket')
+    parser.add_argument('--socket',
+                        help='Daemon socket path; with --audio-file, submit to a running daemon '
+                             f'(default for --serve: {DEFAULT_SOCKET_PATH})')
+    parser.add_argument('--json', action='store_true',
+                        help='Print one JSON result object per recording on stdout; '
+                             'progress goes to stderr')
 
     args = parser.parse_args()
+    if args.audio_file:
+        args.audio_file = expand_audio_paths(args.audio_file)
+
+    # Progress messages go through the module logger; print them plainly like the rest of the CLI
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # With --json, stdout carries only the results so it can be piped into jq
+    stdout = sys.stdout
+    if args.json:
+        sys.stdout = sys.stderr
 
     try:
+        # Submit to a running daemon instead of loading models here
+        if args.socket and not args.serve:
+            if not args.audio_file:
+                print("❌ --socket requires --audio-file")
+                return 1
+            if len(args.audio_file) > 1:
+                request = {'op': 'process_audio_files', 'audio_files': args.audio_file}
+            else:
+                request = {'op': 'process_audio_file', 'audio_file': args.audio_file[0],
+                           'title': args.title}
+            request['create_note'] = not args.no_note
+            batch_results = submit_job(request, args.socket)
+            if not isinstance(batch_results, list):
+                batch_results = [batch_results]
+            stdout.write(_format_results(batch_results, args.no_note, args.json))
+            return 0
+
         # Initialize processor
         processor = AutoNoteProcessor(
             asr_url=args.asr_url,
+            asr_socket=args.asr_socket,
             onenote_client_id=args.onenote_client_id,
             onenote_tenant_id=args.onenote_tenant_id,
             onenote_client_secret=args.onenote_client_secret,
             summarizer_model=args.summarizer_model,
-            note_storage=args.note_storage
+            # Skip probing and loading note storage entirely when no note is wanted
+            note_storage='none' if args.no_note else args.note_storage,
+            summarizer_backend=args.summarizer_backend,
+            summarizer_url=args.summarizer_url,
+            summarizer_dtype=args.summarizer_dtype,
+            summarizer_compile=args.summarizer_compile,
+            summarizer_runtime=args.summarizer_runtime,
+            local_notes_dir=args.local_notes_dir
         )
 
-        # Configure local notes directory if specified
-        if args.local_notes_dir and hasattr(processor, 'local_notes') and processor.local_notes:
-            # Re-initialize local notes with custom directory
-            from .local_notes import LocalNoteManager
-            processor.local_notes = LocalNoteManager(base_dir=args.local_notes_dir)
+        if args.serve:
+            asyncio.run(processor.serve(args.socket or DEFAULT_SOCKET_PATH))
+            return 0
 
         # Process audio
-        if args.audio_file:
-            print(f"🎵 Processing audio file: {args.audio_file}")
-            results = processor.process_audio_file(
-                audio_file=args.audio_file,
-                title=args.title,
+        if args.audio_file and len(args.audio_file) > 1:
+            batch_results = processor.process_audio_files(
+                audio_files=args.audio_file,
                 create_note=not args.no_note
             )
 
+        elif args.audio_file:
+            batch_results = [processor.process_audio_file(
+                audio_file=args.audio_file[0],
+                title=args.title,
+                create_note=not args.no_note
+            )]
+
         elif args.record:
-            print(f"🎤 Recording live audio for {args.duration} seconds...")
-            results = processor.process_live_recording(
+            batch_results = [processor.process_live_recording(
                 duration=args.duration,
                 title=args.title,
-                create_note=not args.no_note
-            )
+                create_note=not args.no_note,
+                save_wav=args.save_wav
+            )]
 
         else:
             print("❌ Please specify --audio-file or --record")
             return 1
 
-        # Display results
-        print("\n" + "="*60)
-        print("📊 PROCESSING RESULTS")
-        print("="*60)
+        stdout.write(_format_results(batch_results, args.no_note, args.json))
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+    finally:
+        sys.stdout = stdout
+
+    return 0
+
+
+def _format_results(batch_results: List[Dict[str, Any]], no_note: bool,
+                    as_json: bool = False) -> str:
+    """
+    Render processing results for stdout, so they are written in one call.
+
+    Args:
+        batch_results: Processing results dictionary for each recording
+        no_note: Whether note creation was disabled
+        as_json: Emit one JSON object per line instead of the human-readable report
+
+    Returns:
+        Text to write to stdout
+    """
+    if as_json:
+        return ''.join(json.dumps(results, default=str) + '\n' for results in batch_results)
+
+    lines = []
+    for results in batch_results:
+        lines += ["", "="*60, "📊 PROCESSING RESULTS", "="*60]
 
         if results['success']:
-            print("✅ Processing completed successfully!")
-            print(".2f")
+            lines.append("✅ Processing completed successfully!")
+            lines.append(f"⏱️  Processing time: {results['processing_time']:.2f} seconds")
 
             if results['transcription']:
-                print(f"📝 Transcription: {len(results['transcription'])} characters")
-                print(f"   Preview: {results['transcription'][:100]}...")
+                lines.append(f"📝 Transcription: {len(results['transcription'])} characters")
+                lines.append(f"   Preview: {results['transcription'][:100]}...")
 
             if results['summary']:
-                print(f"📋 Summary: {len(results['summary'])} characters")
-                print(f"   Preview: {results['summary'][:100]}...")
+                lines.append(f"📋 Summary: {len(results['summary'])} characters")
+                lines.append(f"   Preview: {results['summary'][:100]}...")
 
             if results['note_created']:
-                print("📓 OneNote: Created successfully")
-            elif not args.no_note:
-                print("📓 OneNote: Skipped or failed")
+                lines.append("📓 OneNote: Created successfully")
+            elif not no_note:
+                lines.append("📓 OneNote: Skipped or failed")
 
         else:
-            print("❌ Processing failed!")
+            lines.append("❌ Processing failed!")
             if results['error']:
-                print(f"   Error: {results['error']}")
-
-        print("="*60)
+                lines.append(f"   Error: {results['error']}")
 
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return 1
-
-    return 0
+        lines.append("="*60)
+    return '\n'.join(lines) + '\n'
 
 
 if __name__ == "__main__":
@@ -1,14 +1,21 @@
 """Gradio interface for the TTS AI Pipeline."""
 
 import os
+import struct
 import tempfile
-from typing import Tuple, Optional
+from typing import AsyncIterator, Tuple, Optional
 import gradio as gr
 import numpy as np
-import scipy.io.wavfile as wav
 import asyncio
+import threading
 import aiohttp
 
+try:
+    # SIMD-accelerated decoding of long transcripts
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Import MCP client
 try:
     from .mcp_client import MCPClient, PromptType
@@ -22,10 +29,90 @@ asr_url = os.getenv("ASR_URL", "http://localhost:8000/transcribe")
 tts_url = os.getenv("TTS_URL", "http://localhost:8001/synthesize")
 mcp_enabled = os.getenv("MCP_ENABLED", "false").lower() == "true"
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Synthesized speech is overwritten in place at one path in a private temp
+# directory; Gradio runs one event at a time and copies the file into its own
+# cache before the next request, so reusing the path is safe
+_OUTPUT_PATH = os.path.join(tempfile.mkdtemp(prefix="tts_"), "output.wav")
+
+# Requests run on one long-lived event loop so a single keep-alive
+# ClientSession can be shared across calls, instead of opening new TCP
+# connections to the ASR and TTS services for every recording
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="interface-http", daemon=True).start()
+    return _loop
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session; must be called on the background loop."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def _wav_stream(sample_rate: int, data: np.ndarray) -> AsyncIterator[bytes]:
+    """Yield a 16-bit PCM WAV file: the 44-byte header, then the samples in 64 KB slices.
+
+    The header sizes are known from ``data.nbytes`` up front, so the upload
+    can start without first serializing the whole file.
+
+    Args:
+        sample_rate: Sample rate in Hz.
+        data: int16 samples, shaped (frames,) or (frames, channels).
+    """
+    data = np.ascontiguousarray(data, dtype='<i2')
+    channels = 1 if data.ndim == 1 else data.shape[1]
+    yield struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + data.nbytes, b'WAVE', b'fmt ', 16, 1,
+                      channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+                      b'data', data.nbytes)
+    view = memoryview(data).cast('B')
+    for start in range(0, len(view), UPLOAD_CHUNK_SIZE):
+        yield view[start:start + UPLOAD_CHUNK_SIZE]
+
+
+async def _ask_copilot(text: str) -> str:
+    """Send the transcription to Copilot via MCP and format the reply."""
+    try:
+        mcp_client = MCPClient()
+        mcp_response = await asyncio.get_running_loop().run_in_executor(
+            None, mcp_client.send_to_copilot, text
+        )
+        return f"\n\n🤖 Copilot Response: {mcp_response.get('result', 'No response')}"
+    except Exception as e:
+        return f"\n\n⚠️ MCP Error: {str(e)}"
+
+
+async def _synthesize(session: aiohttp.ClientSession, text: str) -> Tuple[int, bytes | str]:
+    """Request speech for ``text`` from the TTS service.
+
+    Returns:
+        Tuple of (HTTP status, audio bytes on success or the error body otherwise).
+    """
+    async with session.post(tts_url, json={"text": text}) as response:
+        if response.status != 200:
+            return response.status, await response.text()
+        return response.status, await response.read()
+
 
 async def process_audio_async(audio: Tuple[int, np.ndarray] | None, enable_mcp: bool = False) -> Tuple[str | None, str]:
     """Process audio input asynchronously: transcribe to text and synthesize back to speech.
 
+    Must run on the loop returned by :func:`_get_loop`, which owns the shared
+    HTTP session; :func:`process_audio` takes care of that.
+
     Args:
         audio: Tuple of (sample_rate, audio_data) from microphone input,
                or None if no audio provided.
@@ -39,54 +126,41 @@ async def process_audio_async(audio: Tuple[int, np.ndarray] | None, enable_mcp:
         return None, "No audio provided"
 
     sample_rate, data = audio
-    # Whisper handles various sample rates, but we save as WAV
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-        wav.write(temp_file.name, sample_rate, data.astype(np.int16))
-        temp_path = temp_file.name
+    # Whisper handles various sample rates, but we send 16-bit WAV. Gradio
+    # usually delivers int16 already, which is written without a copy.
+    if np.issubdtype(data.dtype, np.floating):
+        data = (data * 32767).clip(-32768, 32767).astype(np.int16)
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            # Send to ASR service asynchronously
-            with open(temp_path, "rb") as f:
-                audio_data = aiohttp.FormData()
-                audio_data.add_field('file', f, filename='audio.wav', content_type='audio/wav')
-
-            async with session.post(asr_url, data=audio_data) as response:
-                if response.status != 200:
-                    return None, f"ASR failed: {await response.text()}"
-
-                asr_result = await response.json()
-                text = asr_result["text"]
-
-            # Process with MCP if enabled
-            mcp_result = ""
-            if enable_mcp and MCP_AVAILABLE and mcp_enabled and MCPClient is not None:
-                try:
-                    mcp_client = MCPClient()
-                    mcp_response = await asyncio.get_event_loop().run_in_executor(
-                        None, mcp_client.send_to_copilot, text
-                    )
-                    mcp_result = f"\n\n🤖 Copilot Response: {mcp_response.get('result', 'No response')}"
-                except Exception as e:
-                    mcp_result = f"\n\n⚠️ MCP Error: {str(e)}"
-
-            # Send text to TTS service asynchronously
-            async with session.post(tts_url, json={"text": text}) as response:
-                if response.status != 200:
-                    return None, f"TTS failed: {await response.text()}"
-
-                audio_content = await response.read()
-
-            output_path = "output.wav"
-            with open(output_path, "wb") as f:
-                f.write(audio_content)
-
-            # Combine transcription with MCP result
-            full_text = text + mcp_result
-
-            return output_path, full_text
-    finally:
-        os.unlink(temp_path)
+    session = _get_session()
+    # Stream the WAV to the ASR service as it is serialized, without a temp file
+    audio_data = aiohttp.FormData()
+    audio_data.add_field('file', _wav_stream(sample_rate, data),
+                         filename='audio.wav', content_type='audio/wav')
+
+    async with session.post(asr_url, data=audio_data) as response:
+        if response.status != 200:
+            return None, f"ASR failed: {await response.text()}"
+
+        asr_result = json_loads(await response.read())
+        text = asr_result["text"]
+
+    # Synthesize speech while Copilot (if enabled) answers; both only need the text
+    tts_task = asyncio.create_task(_synthesize(session, text))
+    mcp_result = ""
+    if enable_mcp and MCP_AVAILABLE and mcp_enabled and MCPClient is not None:
+        mcp_result = await _ask_copilot(text)
+
+    status, audio_content = await tts_task
+    if status != 200:
+        return None, f"TTS failed: {audio_content}"
+
+    with open(_OUTPUT_PATH, "wb") as f:
+        f.write(audio_content)
+
+    # Combine transcription with MCP result
+    full_text = text + mcp_result
+
+    return _OUTPUT_PATH, full_text
 
 
 def process_audio(audio: Tuple[int, np.ndarray] | None, enable_mcp: bool = False) -> Tuple[str | None, str]:
@@ -102,12 +176,31 @@ def process_audio(audio: Tuple[int, np.ndarray] | None, enable_mcp: bool = False
         Returns (None, error_message) if processing fails.
     """
     try:
-        # Run async function in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(process_audio_async(audio, enable_mcp))
-        loop.close()
-        return result
+        # Run on the shared background loop so the HTTP session is reused
+        coro = process_audio_async(audio, enable_mcp)
+        future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+        return future.result()
+    except Exception as e:
+        return None, f"Processing failed: {str(e)}"
+
+
+async def handle_audio(audio: Tuple[int, np.ndarray] | None,
+                       enable_mcp: bool = False) -> Tuple[str | None, str]:
+    """Gradio handler: await processing on the shared loop without blocking a worker thread.
+
+    Args:
+        audio: Tuple of (sample_rate, audio_data) from microphone input,
+               or None if no audio provided.
+        enable_mcp: Whether to send transcription to Copilot via MCP
+
+    Returns:
+        Tuple of (output_audio_path, transcribed_text).
+        Returns (None, error_message) if processing fails.
+    """
+    try:
+        coro = process_audio_async(audio, enable_mcp)
+        future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+        return await asyncio.wrap_future(future)
     except Exception as e:
         return None, f"Processing failed: {str(e)}"
 
@@ -124,7 +217,7 @@ def create_interface() -> gr.Interface:
         description += " Optionally send transcription to Copilot for AI assistance."
 
     return gr.Interface(
-        fn=process_audio,
+        fn=handle_audio,
         inputs=[
             gr.Audio(sources=["microphone"], type="numpy", label="Audio Input"),
             gr.Checkbox(
@@ -23,7 +23,7 @@ import os
 import json
 import shutil
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from datetime import datetime
 import re
 
@@ -340,29 +340,47 @@ class LocalNoteManager:
         query_lower = query.lower()
 
         # Search through all note files
-        for notebook_dir in self.notes_dir.iterdir():
-            if notebook_dir.is_dir():
-                for section_dir in notebook_dir.iterdir():
-                    if section_dir.is_dir():
-                        for note_file in section_dir.iterdir():
-                            if note_file.is_file() and note_file.suffix in ['.md', '.html']:
-                                try:
-                                    with open(note_file, 'r', encoding='utf-8') as f:
-                                        content = f.read().lower()
-
-                                    if query_lower in content:
-                                        results.append({
-                                            'path': str(note_file),
-                                            'notebook': notebook_dir.name,
-                                            'section': section_dir.name,
-                                            'filename': note_file.name,
-                                            'modified': datetime.fromtimestamp(note_file.stat().st_mtime).isoformat()
-                                        })
-                                except Exception:
-                                    continue
+        for notebook, section, entry in self._iter_note_files():
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    content = f.read().lower()
+
+                if query_lower in content:
+                    results.append({
+                        'path': entry.path,
+                        'notebook': notebook,
+                        'section': section,
+                        'filename': entry.name,
+                        'modified': datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+                    })
+            except Exception:
+                continue
 
         return results
 
+    def _iter_note_files(self) -> Iterator[Tuple[str, str, os.DirEntry]]:
+        """
+        Walk notebook/section directories, yielding note files.
+
+        Uses ``os.scandir`` so file-type checks come from the directory
+        listing and each note is stat'ed at most once.
+
+        Yields:
+            Tuples of (notebook name, section name, ``os.DirEntry`` of the note)
+        """
+        with os.scandir(self.notes_dir) as notebooks:
+            for notebook in notebooks:
+                if not notebook.is_dir():
+                    continue
+                with os.scandir(notebook.path) as sections:
+                    for section in sections:
+                        if not section.is_dir():
+                            continue
+                        with os.scandir(section.path) as notes:
+                            for note in notes:
+                                if note.is_file() and note.name.endswith(('.md', '.html')):
+                                    yield notebook.name, section.name, note
+
     def get_note_content(self, note_path: str) -> Optional[str]:
         """Get content of a specific note."""
         try:
@@ -376,14 +394,9 @@ class LocalNoteManager:
         total_notes = 0
         total_size = 0
 
-        for notebook_dir in self.notes_dir.iterdir():
-            if notebook_dir.is_dir():
-                for section_dir in notebook_dir.iterdir():
-                    if section_dir.is_dir():
-                        for note_file in section_dir.iterdir():
-                            if note_file.is_file() and note_file.suffix in ['.md', '.html']:
-                                total_notes += 1
-                                total_size += note_file.stat().st_size
+        for _, _, entry in self._iter_note_files():
+            total_notes += 1
+            total_size += entry.stat().st_size
 
         return {
             'total_notebooks': len(self.metadata["notebooks"]),
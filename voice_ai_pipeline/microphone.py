@@ -37,39 +37,74 @@ except ImportError:
 import numpy as np
 import time
 import os
-import sys
-import tempfile
-from typing import Optional, List, Tuple
-import requests
-import json
-
-import pyaudio
+import threading
+import mmap
 import wave
-import numpy as np
-import time
-import os
-import sys
-import tempfile
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import uuid
+from contextlib import ExitStack
+from typing import Iterator, Optional, List, Tuple
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # SIMD-accelerated decoding of long transcripts
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    json_loads = json.loads
+
+from ._fast_audio import SILENCE_THRESHOLD, is_voiced, speech_bounds
+from ._unix_http import UnixSocketAdapter
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Files sent per /transcribe_batch request
+ASR_BATCH_SIZE = 8
+# Batch requests in flight at once, so the ASR server can overlap decoding
+# one batch with receiving the next
+ASR_MAX_CONCURRENCY = min(4, os.cpu_count() or 1)
 
 
 class MicrophoneRecorder:
     """Microphone recording component for ASR testing."""
 
-    def __init__(self, asr_url: str = "http://localhost:8000"):
+    def __init__(self, asr_url: str = "http://localhost:8000", frames_per_buffer: int = 1024,
+                 session: Optional[requests.Session] = None, asr_socket: Optional[str] = None):
+        """
+        Initialize the microphone recorder.
+
+        Args:
+            asr_url: URL of the ASR service
+            frames_per_buffer: Samples read per buffer (1024 is 64 ms at 16 kHz)
+            session: HTTP session for ASR requests (default: a new pooled
+                keep-alive session with connection retries)
+            asr_socket: Unix socket of a co-located ASR service; requests to
+                ``asr_url`` then bypass TCP loopback
+        """
         if not PYAUDIO_AVAILABLE:
             raise ImportError("PyAudio is not available. Please install it with: pip install pyaudio")
         
         self.asr_url = asr_url
+        self._owns_session = session is None
+        self.session = session or self._create_session()
+        if asr_socket:
+            self.session.mount(asr_url, UnixSocketAdapter(asr_socket, pool_connections=1,
+                                                          pool_maxsize=8))
         self.audio = pyaudio.PyAudio()  # type: ignore
         self.stream: Optional[pyaudio.Stream] = None  # type: ignore
-        self.frames = []
+        self.samples = np.empty(0, dtype=np.int16)
+        self.num_samples = 0
         self.is_recording = False
+        self.recording_complete = threading.Event()
+        # Set by the stream callback once a fixed-duration recording is captured
+        self._capture_done = threading.Event()
+        self._target_samples: Optional[int] = None
 
         # Audio parameters
-        self.chunk = 1024
+        self.chunk = frames_per_buffer
         self.format = pyaudio.paInt16  # type: ignore
         self.channels = 1
         self.rate = 16000  # 16kHz for better ASR performance
@@ -122,40 +157,35 @@ class MicrophoneRecorder:
             print(f"🎤 Starting recording from: {device_info.get('name')}")
             print("   Press Ctrl+C to stop recording" if duration is None else f"   Recording for {duration} seconds...")
 
+            # Preallocate for the full duration (or ~30 s when open-ended), rounded
+            # up to whole buffers so the last callback never forces a regrow
+            buffers = -(-int(self.rate * (duration or 30)) // self.chunk)
+            self.samples = np.empty(buffers * self.chunk, dtype=np.int16)
+            self.num_samples = 0
+            self._target_samples = int(self.rate * duration) if duration else None
+            self._capture_done.clear()
+            self.is_recording = True
+            self.recording_complete.clear()
+
+            # PortAudio delivers buffers to _on_audio on its own thread, so
+            # capture keeps up even while this thread is blocked on the GIL
             self.stream = self.audio.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.rate,
                 input=True,
                 input_device_index=device_index,
-                frames_per_buffer=self.chunk
+                frames_per_buffer=self.chunk,
+                stream_callback=self._on_audio
             )
 
-            self.frames = []
-            self.is_recording = True
-
-            if duration:
-                # Record for specified duration
-                for _ in range(int(self.rate / self.chunk * duration)):
-                    if not self.is_recording:
-                        break
-                    data = self.stream.read(self.chunk)
-                    self.frames.append(data)
-                self.stop_recording()
-            else:
-                # Record until manually stopped
-                try:
-                    while self.is_recording:
-                        data = self.stream.read(self.chunk)
-                        self.frames.append(data)
-                        # Simple audio level monitoring
-                        audio_data = np.frombuffer(data, dtype=np.int16)
-                        rms = np.sqrt(np.mean(audio_data**2))
-                        if rms > 100:  # Basic voice activity detection
-                            print(".", end="", flush=True)
-                except KeyboardInterrupt:
-                    print("\n🛑 Recording stopped by user")
-                    self.stop_recording()
+            try:
+                # Wait for the duration to be captured or a manual stop
+                while self.is_recording and not self._capture_done.wait(0.05):
+                    pass
+            except KeyboardInterrupt:
+                print("\n🛑 Recording stopped by user")
+            self.stop_recording()
 
             return True
 
@@ -163,12 +193,101 @@ class MicrophoneRecorder:
             print(f"❌ Failed to start recording: {e}")
             return False
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session so repeated ASR calls skip the TCP handshake."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _on_audio(self, in_data: bytes, frame_count: int, time_info: dict, status: int):
+        """PyAudio stream callback: store one buffer of input audio."""
+        audio_data = self._append(in_data)
+        if self._target_samples is None:
+            # Simple audio level monitoring
+            if is_voiced(audio_data):  # Basic voice activity detection
+                print(".", end="", flush=True)
+        elif self.num_samples >= self._target_samples:
+            self.num_samples = self._target_samples
+            self._capture_done.set()
+            return None, pyaudio.paComplete  # type: ignore
+        return None, pyaudio.paContinue  # type: ignore
+
+    def _append(self, data: bytes) -> np.ndarray:
+        """
+        Copy a chunk of int16 PCM into the sample buffer, growing it if full.
+
+        Args:
+            data: Raw bytes read from the stream
+
+        Returns:
+            View of the newly written samples
+        """
+        chunk = np.frombuffer(data, dtype=np.int16)
+        end = self.num_samples + len(chunk)
+        if end > len(self.samples):
+            grown = np.empty(max(end, 2 * len(self.samples)), dtype=np.int16)
+            grown[:self.num_samples] = self.samples[:self.num_samples]
+            self.samples = grown
+        self.samples[self.num_samples:end] = chunk
+        self.num_samples = end
+        return self.samples[end - len(chunk):end]
+
+    @property
+    def recorded_audio(self) -> np.ndarray:
+        """View of the int16 samples captured by the last recording."""
+        return self.samples[:self.num_samples]
+
+    def trim_silence(self, threshold: int = SILENCE_THRESHOLD) -> None:
+        """
+        Drop leading and trailing silence from the last recording.
+
+        Args:
+            threshold: Minimum absolute int16 amplitude of a non-silent sample
+        """
+        start, end = speech_bounds(self.recorded_audio, threshold)
+        self.samples = self.samples[start:end]
+        self.num_samples = end - start
+
+    def get_recording_bytes(self) -> Tuple[int, np.ndarray]:
+        """
+        Return the last recording as it is held in memory, without encoding it.
+
+        Returns:
+            Tuple of (sample rate, int16 samples view)
+        """
+        return self.rate, self.recorded_audio
+
+    def get_recording_metadata(self) -> dict:
+        """
+        Describe the last recording from the in-memory buffer, without touching disk.
+
+        Returns:
+            Metadata dictionary (duration, speech duration, sample rate, channels, size)
+        """
+        rate, pcm = self.get_recording_bytes()
+        pcm_bytes = pcm.nbytes
+        start, end = speech_bounds(pcm)
+        return {
+            'duration_seconds': round(pcm.size / (rate * self.channels), 2),
+            'speech_duration_seconds': round((end - start) / (rate * self.channels), 2),
+            'sample_rate': rate,
+            'channels': self.channels,
+            'pcm_bytes': pcm_bytes,
+            'file_size_mb': round(pcm_bytes / (1024 * 1024), 2),
+            'created_timestamp': datetime.now().isoformat()
+        }
+
     def stop_recording(self):
         """Stop the current recording."""
         if self.stream and self.is_recording:
             self.is_recording = False
             self.stream.stop_stream()
             self.stream.close()
+            self.recording_complete.set()
             print("✅ Recording stopped")
 
     def save_recording(self, filename: str) -> bool:
@@ -181,7 +300,7 @@ class MicrophoneRecorder:
         Returns:
             True if saved successfully
         """
-        if not self.frames:
+        if not self.num_samples:
             print("❌ No audio data to save")
             return False
 
@@ -190,7 +309,7 @@ class MicrophoneRecorder:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(self.audio.get_sample_size(self.format))
                 wf.setframerate(self.rate)
-                wf.writeframes(b''.join(self.frames))
+                wf.writeframes(self.recorded_audio)
 
             file_size = os.path.getsize(filename)
             print(f"💾 Audio saved to {filename} ({file_size} bytes)")
@@ -211,16 +330,18 @@ class MicrophoneRecorder:
             Transcribed text or None if failed
         """
         try:
-            with open(audio_file, 'rb') as f:
-                files = {'file': f}
-                response = requests.post(
+            boundary = uuid.uuid4().hex
+            with ExitStack() as stack:
+                mm = self._map_file(stack, audio_file)
+                response = self.session.post(
                     f"{self.asr_url}/transcribe",
-                    files=files,
+                    data=self._multipart_body([(os.path.basename(audio_file), mm)], boundary),
+                    headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
                     timeout=30
                 )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 text = data.get('text', '').strip()
                 print(f"📝 Transcription: '{text}'")
                 return text
@@ -232,14 +353,215 @@ class MicrophoneRecorder:
             print(f"❌ Transcription failed: {e}")
             return None
 
+    def transcribe_recording_stream(self, audio_file: str) -> Iterator[str]:
+        """
+        Transcribe recorded audio, yielding segments as the ASR service decodes them.
+
+        Uses the Server-Sent Events endpoint, so callers can start working on
+        the beginning of a long recording before the rest is transcribed.
+
+        Args:
+            audio_file: Path to audio file
+
+        Yields:
+            Transcribed text of each segment (nothing if the request failed)
+        """
+        try:
+            boundary = uuid.uuid4().hex
+            with ExitStack() as stack:
+                mm = self._map_file(stack, audio_file)
+                response = self.session.post(
+                    f"{self.asr_url}/transcribe_stream",
+                    data=self._multipart_body([(os.path.basename(audio_file), mm)], boundary),
+                    headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+                    timeout=30,
+                    stream=True
+                )
+
+            with response:
+                if response.status_code != 200:
+                    print(f"❌ ASR request failed: HTTP {response.status_code}")
+                    return
+                for line in response.iter_lines(decode_unicode=True):
+                    if line and line.startswith('data: '):
+                        text = line[len('data: '):].strip()
+                        if text:
+                            yield text
+
+        except Exception as e:
+            print(f"❌ Transcription failed: {e}")
+
+    @staticmethod
+    def _multipart_body(files: List[Tuple[str, mmap.mmap]], boundary: str,
+                        field: str = 'file') -> Iterator[bytes]:
+        """
+        Yield a multipart/form-data body of file parts in 64 KB pieces.
+
+        Streaming from the memory-mapped files keeps large recordings out of
+        Python memory; requests would otherwise build the whole body up front.
+
+        Args:
+            files: (filename, memory-mapped contents) pairs, one form part each
+            boundary: Multipart boundary
+            field: Form field name of every part
+
+        Yields:
+            Consecutive pieces of the request body
+        """
+        for filename, data in files:
+            yield (f'--{boundary}\r\n'
+                   f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+                   f'Content-Type: application/octet-stream\r\n\r\n').encode('utf-8')
+            for start in range(0, len(data), UPLOAD_CHUNK_SIZE):
+                yield data[start:start + UPLOAD_CHUNK_SIZE]
+            yield b'\r\n'
+        yield f'--{boundary}--\r\n'.encode('utf-8')
+
+    @staticmethod
+    def _map_file(stack: ExitStack, path: str) -> mmap.mmap:
+        """Memory-map ``path`` for reading, closed with ``stack`` (empty files map to b'')."""
+        f = stack.enter_context(open(path, 'rb'))
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def transcribe_batch(self, audio_files: List[str], batch_size: int = ASR_BATCH_SIZE,
+                         max_concurrency: int = ASR_MAX_CONCURRENCY) -> List[Optional[str]]:
+        """
+        Transcribe several audio files through the ASR batch endpoint.
+
+        Files are sorted by size, a proxy for duration, and sent
+        ``batch_size`` at a time, so each batched forward pass on the server
+        pads its inputs to a similar length. Up to ``max_concurrency``
+        batch requests are in flight at once.
+
+        Args:
+            audio_files: Paths to audio files
+            batch_size: Number of files per request
+            max_concurrency: Maximum number of concurrent batch requests
+
+        Returns:
+            Transcribed text for each file, in input order (None for files whose request failed)
+        """
+        def size(i: int) -> int:
+            # Missing files sort first; their request reports the error
+            try:
+                return os.path.getsize(audio_files[i])
+            except OSError:
+                return 0
+
+        texts: List[Optional[str]] = [None] * len(audio_files)
+        order = sorted(range(len(audio_files)), key=size)
+        batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(batches)))) as pool:
+            responses = pool.map(self._transcribe_batch_request,
+                                 [[audio_files[i] for i in batch] for batch in batches])
+            for batch, batch_texts in zip(batches, responses):
+                for i, text in zip(batch, batch_texts):
+                    texts[i] = text
+
+        print(f"📝 Transcribed {sum(text is not None for text in texts)} of {len(texts)} files")
+        return texts
+
+    def _transcribe_batch_request(self, audio_files: List[str]) -> List[Optional[str]]:
+        """Send one /transcribe_batch request; returns None for every file if it failed."""
+        try:
+            boundary = uuid.uuid4().hex
+            with ExitStack() as stack:
+                files = [(os.path.basename(path), self._map_file(stack, path))
+                         for path in audio_files]
+                response = self.session.post(
+                    f"{self.asr_url}/transcribe_batch",
+                    data=self._multipart_body(files, boundary, field='files'),
+                    headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+                    timeout=30 * len(audio_files)
+                )
+
+            if response.status_code == 200:
+                return [text.strip() for text in json_loads(response.content).get('texts', [])]
+            else:
+                print(f"❌ ASR batch request failed: HTTP {response.status_code}")
+                return [None] * len(audio_files)
+
+        except Exception as e:
+            print(f"❌ Batch transcription failed: {e}")
+            return [None] * len(audio_files)
+
+    def transcribe_pcm(self, pcm: np.ndarray) -> Optional[str]:
+        """
+        Transcribe in-memory int16 PCM through the ASR raw-audio endpoint.
+
+        Args:
+            pcm: Mono int16 samples at the recorder's sample rate
+
+        Returns:
+            Transcribed text or None if failed
+        """
+        try:
+            response = self.session.post(
+                f"{self.asr_url}/transcribe_raw",
+                data=(pcm.astype(np.float32) / 32768.0).tobytes(),
+                params={'sample_rate': self.rate},
+                timeout=30
+            )
+            if response.status_code == 200:
+                return json_loads(response.content).get('text', '').strip()
+            print(f"❌ ASR request failed: HTTP {response.status_code}")
+            return None
+
+        except Exception as e:
+            print(f"❌ Transcription failed: {e}")
+            return None
+
+    def stream_transcribe(self, device_index: Optional[int] = None, duration: float = 10.0,
+                          window_seconds: float = 5.0) -> Iterator[str]:
+        """
+        Record audio and transcribe it window by window while recording continues.
+
+        Recording runs on a background thread; each completed window of
+        ``window_seconds`` is sent to the ASR service as soon as it is
+        captured. Windows that are entirely silent are not sent.
+
+        Args:
+            device_index: Audio device index
+            duration: Recording duration in seconds
+            window_seconds: Length of audio sent per ASR request
+
+        Yields:
+            Transcribed text of each window, in order
+        """
+        self.num_samples = 0
+        recorder = threading.Thread(target=self.start_recording, args=(device_index, duration),
+                                    daemon=True)
+        recorder.start()
+
+        window = int(self.rate * window_seconds)
+        sent = 0
+        while True:
+            finished = not recorder.is_alive()
+            available = self.num_samples
+            if available - sent >= window or (finished and available > sent):
+                end = available if finished else sent + window
+                pcm = self.samples[sent:end]
+                sent = end
+                if speech_bounds(pcm) != (0, 0):
+                    text = self.transcribe_pcm(pcm)
+                    if text:
+                        yield text
+            elif finished:
+                return
+            else:
+                time.sleep(0.05)
+
     def record_and_transcribe(self, device_index: Optional[int] = None,
-                            duration: float = 5.0) -> Optional[str]:
+                              duration: float = 5.0, trim: bool = False) -> Optional[str]:
         """
         Record audio and immediately transcribe it.
 
         Args:
             device_index: Audio device index
             duration: Recording duration in seconds
+            trim: Drop leading and trailing silence before uploading
 
         Returns:
             Transcribed text or None if failed
@@ -248,27 +570,19 @@ class MicrophoneRecorder:
         if not self.start_recording(device_index, duration):
             return None
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-
-        try:
-            if not self.save_recording(temp_filename):
-                return None
-
-            # Transcribe
-            return self.transcribe_recording(temp_filename)
+        if trim:
+            self.trim_silence()
 
-        finally:
-            # Clean up
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
+        # Send the samples straight from memory; no temporary WAV file
+        return self.transcribe_pcm(self.recorded_audio)
 
     def cleanup(self):
         """Clean up resources."""
         if self.stream:
             self.stop_recording()
         self.audio.terminate()
+        if self._owns_session:
+            self.session.close()
 
 
 def main():
@@ -280,6 +594,8 @@ def main():
     parser.add_argument('--device', type=int, help='Audio device index')
     parser.add_argument('--duration', type=float, default=5.0, help='Recording duration in seconds')
     parser.add_argument('--asr-url', default='http://localhost:8000', help='ASR service URL')
+    parser.add_argument('--asr-socket', default=os.getenv('ASR_SOCKET'),
+                        help='Unix socket of a co-located ASR service (env: ASR_SOCKET)')
     parser.add_argument('--output', help='Output WAV file path')
     parser.add_argument('--test', action='store_true', help='Record and transcribe test')
 
@@ -298,7 +614,7 @@ def main():
 
     recorder = None
     try:
-        recorder = MicrophoneRecorder(args.asr_url)
+        recorder = MicrophoneRecorder(args.asr_url, asr_socket=args.asr_socket)
 
         if args.list_devices:
             devices = recorder.list_devices()
@@ -26,8 +26,11 @@ Setup:
 import os
 import json
 import time
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import base64
+from html import escape
+from typing import Optional, Dict, Any, List, Tuple
+
+import requests
 
 try:
     from msgraph import GraphServiceClient
@@ -43,12 +46,40 @@ except ImportError:
     ClientException = None
     MSGRAPH_AVAILABLE = False
 
+GRAPH_SCOPE = 'https://graph.microsoft.com/.default'
+GRAPH_BATCH_URL = 'https://graph.microsoft.com/v1.0/$batch'
+GRAPH_BATCH_LIMIT = 20  # Maximum requests per Graph JSON batch
+
+# Note page templates, parsed once; every interpolated value is HTML-escaped
+_NOTE_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>{title}</title>
+        </head>
+        <body>
+            <h1>{title}</h1>
+            <p><strong>Created:</strong> {timestamp}</p>
+        """
+_NOTE_METADATA_ITEM = "<li><strong>{key}:</strong> {value}</li>"
+_NOTE_BODY = """
+            <h2>Summary</h2>
+            <p>{summary}</p>
+
+            <h2>Full Transcription</h2>
+            <div style="border: 1px solid #ccc; padding: 10px; margin: 10px 0;">
+                {transcription}
+            </div>
+        </body>
+        </html>
+        """
+
 
 class OneNoteManager:
     """Microsoft OneNote integration manager."""
 
     def __init__(self, client_id: Optional[str] = None, tenant_id: Optional[str] = None,
-                 client_secret: Optional[str] = None):
+                 client_secret: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize OneNote manager.
 
@@ -56,6 +87,7 @@ class OneNoteManager:
             client_id: Azure app client ID
             tenant_id: Azure tenant ID
             client_secret: Azure app client secret (for service principal auth)
+            session: HTTP session for direct Graph requests, so connections are reused
         """
         if not MSGRAPH_AVAILABLE:
             raise ImportError("Microsoft Graph SDK is not available. Please install with: pip install msgraph-sdk azure-identity")
@@ -68,6 +100,11 @@ class OneNoteManager:
             raise ValueError("Client ID is required. Set AZURE_CLIENT_ID environment variable or pass client_id parameter.")
 
         self.graph_client = None
+        self.credential = None
+        self.session = session or requests.Session()
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._section_ids: Dict[Tuple[str, str], str] = {}
         self._authenticate()
 
     def _authenticate(self):
@@ -87,7 +124,8 @@ class OneNoteManager:
                     tenant_id=self.tenant_id
                 )
 
-            scopes = ['https://graph.microsoft.com/.default']
+            scopes = [GRAPH_SCOPE]
+            self.credential = credential
             self.graph_client = GraphServiceClient(credential, scopes)
 
             print("✅ Successfully authenticated with Microsoft Graph")
@@ -210,8 +248,39 @@ class OneNoteManager:
             print(f"❌ Failed to get/create section: {e}")
             return None
 
+    def _get_token(self) -> str:
+        """Return a Graph bearer token, reusing the cached one until a minute before expiry."""
+        if self._token is None or time.time() >= self._token_expires_at - 60:
+            access_token = self.credential.get_token(GRAPH_SCOPE)
+            self._token = access_token.token
+            self._token_expires_at = access_token.expires_on
+        return self._token
+
+    def get_section_id(self, notebook_name: str = "AI Transcriptions",
+                       section_name: str = "Transcriptions") -> Optional[str]:
+        """
+        Resolve (creating if needed) a section ID, memoized for the session.
+
+        Args:
+            notebook_name: Name of the notebook
+            section_name: Name of the section
+
+        Returns:
+            Section ID or None if failed
+        """
+        key = (notebook_name, section_name)
+        if key not in self._section_ids:
+            notebook_id = self.get_or_create_notebook(notebook_name)
+            if not notebook_id:
+                return None
+            section_id = self.get_or_create_section(notebook_id, section_name)
+            if not section_id:
+                return None
+            self._section_ids[key] = section_id
+        return self._section_ids[key]
+
     def create_note_page(self, section_id: str, title: str, transcription: str,
-                        summary: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+                         summary: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Create a new note page with transcription and summary.
 
@@ -243,7 +312,8 @@ class OneNoteManager:
             return None
 
     def _format_note_html(self, title: str, transcription: str, summary: str,
-                         metadata: Optional[Dict[str, Any]] = None) -> str:
+                          metadata: Optional[Dict[str, Any]] = None,
+                          timestamp: Optional[str] = None) -> str:
         """
         Format the note content as HTML.
 
@@ -252,46 +322,33 @@ class OneNoteManager:
             transcription: Full transcription
             summary: Summary text
             metadata: Additional metadata
+            timestamp: Creation time shown in the note (default: now), so a
+                batch can format it once for all pages
 
         Returns:
             HTML formatted content
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if timestamp is None:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{title}</title>
-        </head>
-        <body>
-            <h1>{title}</h1>
-            <p><strong>Created:</strong> {timestamp}</p>
-        """
+        parts = [_NOTE_HEAD.format(title=escape(title), timestamp=timestamp)]
 
         if metadata:
-            html += "<h2>Metadata</h2><ul>"
-            for key, value in metadata.items():
-                html += f"<li><strong>{key}:</strong> {value}</li>"
-            html += "</ul>"
-
-        html += f"""
-            <h2>Summary</h2>
-            <p>{summary}</p>
+            parts.append("<h2>Metadata</h2><ul>")
+            parts.extend(_NOTE_METADATA_ITEM.format(key=escape(str(key)), value=escape(str(value)))
+                         for key, value in metadata.items())
+            parts.append("</ul>")
 
-            <h2>Full Transcription</h2>
-            <div style="border: 1px solid #ccc; padding: 10px; margin: 10px 0;">
-                {transcription.replace(chr(10), '<br>')}
-            </div>
-        </body>
-        </html>
-        """
+        parts.append(_NOTE_BODY.format(
+            summary=escape(summary),
+            transcription=escape(transcription).replace('\n', '<br>')
+        ))
 
-        return html
+        return ''.join(parts)
 
     def create_transcription_note(self, transcription: str, summary: str,
-                                title: Optional[str] = None,
-                                metadata: Optional[Dict[str, Any]] = None) -> bool:
+                                  title: Optional[str] = None,
+                                  metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         Create a complete transcription note with automatic notebook/section management.
 
@@ -307,16 +364,11 @@ class OneNoteManager:
         try:
             # Auto-generate title if not provided
             if not title:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 title = f"AI Transcription {timestamp}"
 
-            # Get or create notebook
-            notebook_id = self.get_or_create_notebook()
-            if not notebook_id:
-                return False
-
-            # Get or create section
-            section_id = self.get_or_create_section(notebook_id)
+            # Get or create notebook and section (cached after the first note)
+            section_id = self.get_section_id()
             if not section_id:
                 return False
 
@@ -329,6 +381,65 @@ class OneNoteManager:
             print(f"❌ Failed to create transcription note: {e}")
             return False
 
+    def create_transcription_notes_batch(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Create several transcription notes using Graph JSON batching.
+
+        Pages are posted to the default notebook/section in groups of up to 20
+        per ``$batch`` request over one pooled HTTPS session.
+
+        Args:
+            entries: Dictionaries with 'transcription', 'summary' and optional
+                'title' and 'metadata' keys
+
+        Returns:
+            Whether each note was created, in input order
+        """
+        created = [False] * len(entries)
+        if not entries:
+            return created
+
+        try:
+            section_id = self.get_section_id()
+            if not section_id:
+                return created
+
+            # Render every page up front so the dispatch loop only serializes and sends
+            now = time.localtime()
+            timestamp = time.strftime('%Y%m%d_%H%M%S', now)
+            created_at = time.strftime('%Y-%m-%d %H:%M:%S', now)
+            page_requests = []
+            for i, entry in enumerate(entries):
+                title = entry.get('title') or f"AI Transcription {timestamp}_{i + 1}"
+                html = self._format_note_html(title, entry['transcription'], entry['summary'],
+                                              entry.get('metadata'), created_at)
+                page_requests.append({
+                    'id': str(i),
+                    'method': 'POST',
+                    'url': f'/me/onenote/sections/{section_id}/pages',
+                    'headers': {'Content-Type': 'text/html'},
+                    # Non-JSON bodies must be base64-encoded inside a batch
+                    'body': base64.b64encode(html.encode('utf-8')).decode('ascii')
+                })
+
+            for start in range(0, len(page_requests), GRAPH_BATCH_LIMIT):
+                requests_body = page_requests[start:start + GRAPH_BATCH_LIMIT]
+
+                headers = {'Authorization': f'Bearer {self._get_token()}'}
+                response = self.session.post(GRAPH_BATCH_URL, json={'requests': requests_body},
+                                             headers=headers, timeout=60)
+                response.raise_for_status()
+
+                for item in response.json().get('responses', []):
+                    created[int(item['id'])] = 200 <= item.get('status', 0) < 300
+
+            print(f"📝 Created {sum(created)}/{len(entries)} note pages")
+            return created
+
+        except Exception as e:
+            print(f"❌ Failed to create note pages in batch: {e}")
+            return created
+
 
 def main():
     """Command-line interface for OneNote manager."""
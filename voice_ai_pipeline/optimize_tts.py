@@ -1,66 +1,104 @@
 import os
 import time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 import torch
 from TTS.api import TTS
 
+SAMPLE_TEXT = "Hello, this is a test of the text to speech system."
+
+
 def get_gpu_memory():
     if torch.cuda.is_available():
         return torch.cuda.get_device_properties(0).total_memory / 1024**3  # GB
     return 0
 
-def main():
-    total_vram = get_gpu_memory()
-    print(f"Total VRAM: {total_vram:.2f} GB")
-
-    # Common TTS models
-    models = [
-        "tts_models/en/ljspeech/tacotron2-DDC_ph",
-        "tts_models/en/ljspeech/tacotron2-DDC",  # if exists
-        "tts_models/en/ljspeech/glow-tts",
-    ]
-
-    sample_text = "Hello, this is a test of the text to speech system."
 
+def bench_models(model_names, device):
+    """Benchmark models one after another on a single device (runs in a worker process)."""
+    output_path = f"temp_output_{os.getpid()}.wav"
+    use_cuda = device.startswith("cuda")
+    if use_cuda:
+        # Timing events are recorded on the current device's stream
+        torch.cuda.set_device(device)
     results = []
 
-    for model_name in models:
+    for model_name in model_names:
         try:
-            print(f"\nBenchmarking TTS {model_name}...")
-            start_load = time.time()
-            tts = TTS(model_name).to("cuda" if torch.cuda.is_available() else "cpu")
-            load_time = time.time() - start_load
+            print(f"\nBenchmarking TTS {model_name} on {device}...")
+            start_load = time.perf_counter()
+            tts = TTS(model_name).to(device)
+            load_time = time.perf_counter() - start_load
 
-            start_synth = time.time()
-            tts.tts_to_file(text=sample_text, file_path="temp_output.wav")
-            synth_time = time.time() - start_synth
+            if use_cuda:
+                # Events measure the device's own timeline, including queued kernels
+                start_event = torch.cuda.Event(enable_timing=True)
+                end_event = torch.cuda.Event(enable_timing=True)
+                start_event.record()
+                tts.tts_to_file(text=SAMPLE_TEXT, file_path=output_path)
+                end_event.record()
+                torch.cuda.synchronize()
+                synth_time = start_event.elapsed_time(end_event) / 1000
+            else:
+                start_synth = time.perf_counter()
+                tts.tts_to_file(text=SAMPLE_TEXT, file_path=output_path)
+                synth_time = time.perf_counter() - start_synth
 
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+            # Freed blocks stay in the caching allocator for the next model
+            del tts
 
             results.append({
                 "model": model_name,
+                "device": device,
                 "load_time": load_time,
                 "synth_time": synth_time,
-                "text_length": len(sample_text)
+                "text_length": len(SAMPLE_TEXT)
             })
 
-            print(f"  Load time: {load_time:.2f}s")
-            print(f"  Synth time: {synth_time:.2f}s")
-            print(f"  Output saved as temp_output.wav")
+            print(f"  {model_name}: load time {load_time:.2f}s, synth time {synth_time:.2f}s")
 
         except Exception as e:
             print(f"  Failed to load {model_name}: {e}")
             continue
 
+    # Clean up
+    if use_cuda:
+        torch.cuda.empty_cache()
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    return results
+
+
+def main():
+    total_vram = get_gpu_memory()
+    print(f"Total VRAM: {total_vram:.2f} GB")
+
+    # Common TTS models
+    models = [
+        "tts_models/en/ljspeech/tacotron2-DDC_ph",
+        "tts_models/en/ljspeech/tacotron2-DDC",  # if exists
+        "tts_models/en/ljspeech/glow-tts",
+    ]
+
+    # One worker per GPU, each benchmarking its share of the models in turn so
+    # no two syntheses share a device and skew each other's timings
+    devices = [f"cuda:{i}" for i in range(torch.cuda.device_count())] or ["cpu"]
+    devices = devices[:len(models)]
+    shares = [models[i::len(devices)] for i in range(len(devices))]
+
+    # spawn, since CUDA cannot be re-initialized in a forked child
+    spawn = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(devices), mp_context=spawn) as executor:
+        results = [r for device_results in executor.map(bench_models, shares, devices)
+                   for r in device_results]
+
     # Recommend
     if results:
         # Fastest
         fastest = min(results, key=lambda x: x["synth_time"])
         print(f"\nRecommended model: {fastest['model']} (fastest synthesis)")
 
-    # Clean up
-    if os.path.exists("temp_output.wav"):
-        os.remove("temp_output.wav")
 
 if __name__ == "__main__":
     main()
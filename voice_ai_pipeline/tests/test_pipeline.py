@@ -18,13 +18,14 @@ Requirements:
     - pyaudio (for microphone testing)
 """
 
+import base64
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
-import tempfile
-import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Tuple
 
 # Service URLs
@@ -32,6 +33,42 @@ ASR_BASE_URL = "http://localhost:8000"
 TTS_BASE_URL = "http://localhost:8001"
 INTERFACE_URL = "http://localhost:7860"
 
+# Texts synthesized for the speech-to-text tests
+ASR_TEST_TEXT = "Hello, this is a test of the ASR system."
+PIPELINE_TEST_TEXT = "The quick brown fox jumps over the lazy dog."
+
+SERVICES = [
+    ("ASR", ASR_BASE_URL),
+    ("TTS", TTS_BASE_URL),
+    ("Interface", INTERFACE_URL)
+]
+
+
+def get_all(http: requests.Session, path: str) -> list:
+    """GET ``path`` from every service concurrently; responses are in SERVICES order."""
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as pool:
+        return list(pool.map(lambda service: http.get(f"{service[1]}{path}", timeout=10), SERVICES))
+
+
+def _is_healthy(url: str) -> bool:
+    """Return True if the service at ``url`` answers its health check."""
+    try:
+        return requests.get(f"{url}/health", timeout=1).ok
+    except requests.exceptions.RequestException:
+        return False
+
+
+def wait_for_services(urls, timeout: float = 60.0) -> bool:
+    """Poll the services' health endpoints until all respond or ``timeout`` expires."""
+    pending = list(urls)
+    deadline = time.monotonic() + timeout
+    while pending:
+        pending = [url for url in pending if not _is_healthy(url)]
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(0.25)
+    return not pending
+
 
 @pytest.fixture(scope="session")
 def docker_containers():
@@ -43,66 +80,34 @@ def docker_containers():
         print("🐳 Starting Docker containers for testing...")
 
         try:
-            # First, stop any running service containers to ensure clean start
+            # One query for every service container and its state
             expected_containers = ["voice-ai-service"]
             result = subprocess.run(
-                ["docker", "ps", "--format", "{{.Names}}"],
+                ["docker", "ps", "-a", "--filter", "name=-service",
+                 "--format", "{{.Names}}\t{{.State}}"],
                 capture_output=True, text=True, check=True
             )
-            running_containers = [name for name in result.stdout.strip().split('\n') if name]
-            containers_to_stop = [name for name in running_containers if name in expected_containers]
+            states = dict(line.split('\t', 1) for line in result.stdout.strip().split('\n') if line)
+            existing_containers = [name for name in expected_containers if name in states]
+
+            # First, stop any running service containers to ensure clean start
+            containers_to_stop = [name for name in existing_containers if states[name] == 'running']
             if containers_to_stop:
                 print(f"   🛑 Stopping running containers: {', '.join(containers_to_stop)}")
                 subprocess.run(["docker", "stop"] + containers_to_stop, capture_output=True)
                 print(f"   ✅ Stopped containers: {', '.join(containers_to_stop)}")
 
-            # Check if containers are already running
-            result = subprocess.run(
-                ["docker", "ps", "--format", "{{.Names}}"],
-                capture_output=True, text=True, check=True
-            )
-            running_containers = [name for name in result.stdout.strip().split('\n') if name]
-
-            # Check for our specific service containers
-            found_containers = [name for name in running_containers if name in expected_containers]
-
-            # Check all containers (running or stopped)
-            all_result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}"],
-                capture_output=True, text=True, check=True
-            )
-            all_containers = [name for name in all_result.stdout.strip().split('\n') if name]
-            existing_containers = [name for name in all_containers if name in expected_containers]
-
-            if len(found_containers) == 1:  # All services should be running in one container
-                print(f"   📦 Found running container: {', '.join(found_containers)}")
-                return True
-            elif len(found_containers) >= 1:  # At least 1 service is running, check for existing stopped containers
-                print(f"   ⚠️  Found running container: {', '.join(found_containers)}")
-                print("   🔍 Checking for existing stopped containers...")
-
-                # Check all containers (running or stopped)
-                all_result = subprocess.run(
-                    ["docker", "ps", "-a", "--filter", "name=-service", "--format", "{{.Names}}"],
-                    capture_output=True, text=True, check=True
-                )
-                all_containers = [name for name in all_result.stdout.strip().split('\n') if name and not name.startswith('buildx')]
-                existing_containers = [name for name in all_containers if any(expected in name for expected in expected_containers)]
-
-                # Start existing containers that are not running
-                containers_to_start = [name for name in expected_containers if name in existing_containers and name not in found_containers]
-                if containers_to_start:
-                    print(f"   🚀 Starting stopped containers: {', '.join(containers_to_start)}")
-                    subprocess.run(["docker", "start"] + containers_to_start, capture_output=True)
-                    time.sleep(5)  # Wait for services to start
-                    return True
-                else:
-                    print("   ❌ No containers to start")
-                    return False
-            else:
+            if not existing_containers:
                 print("   ❌ No service containers found")
                 return False
 
+            print(f"   🚀 Starting containers: {', '.join(existing_containers)}")
+            subprocess.run(["docker", "start"] + existing_containers, capture_output=True)
+            # Wait for services to start
+            if not wait_for_services([url for _, url in SERVICES]):
+                print("   ⚠️  Services did not report healthy in time")
+            return True
+
         except subprocess.CalledProcessError as e:
             print(f"   ❌ Docker command failed: {e}")
             return False
@@ -149,32 +154,53 @@ def docker_containers():
     stop_containers()
 
 
-def test_service_health(docker_containers):
+@pytest.fixture(scope="session")
+def http():
+    """Keep-alive HTTP session shared by the service tests."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    yield session
+    session.close()
+
+
+def synthesize_batch(http: requests.Session, texts: list) -> list:
+    """Synthesize several texts in one TTS request; WAV bytes are returned in input order."""
+    response = http.post(f"{TTS_BASE_URL}/synthesize_batch", json={"texts": texts},
+                         timeout=30 * len(texts))
+    if response.status_code == 404:
+        # Older TTS service without the batch endpoint
+        responses = [http.post(f"{TTS_BASE_URL}/synthesize", json={"text": text}, timeout=30)
+                     for text in texts]
+        for response in responses:
+            assert response.status_code == 200, f"TTS synthesis failed: HTTP {response.status_code}"
+        return [response.content for response in responses]
+
+    assert response.status_code == 200, f"TTS batch synthesis failed: HTTP {response.status_code}"
+    return [base64.b64decode(audio) for audio in response.json()["audio"]]
+
+
+@pytest.fixture(scope="session")
+def synthesized_audio(docker_containers, http):
+    """WAV audio of every speech-to-text test text, synthesized in one batch."""
+    texts = [ASR_TEST_TEXT, PIPELINE_TEST_TEXT]
+    try:
+        return dict(zip(texts, synthesize_batch(http, texts)))
+    except requests.exceptions.RequestException as e:
+        pytest.fail(f"TTS batch synthesis failed: {e}")
+
+
+def test_service_health(docker_containers, http):
     """Test service health endpoints."""
-    services = [
-        ("ASR", ASR_BASE_URL),
-        ("TTS", TTS_BASE_URL),
-        ("Interface", INTERFACE_URL)
-    ]
-
-    for service_name, url in services:
-        response = requests.get(f"{url}/health", timeout=10)
+    for (service_name, _), response in zip(SERVICES, get_all(http, "/health")):
         assert response.status_code == 200, f"{service_name} health check failed with status {response.status_code}"
 
         data = response.json()
         assert data.get("healthy") == True, f"{service_name} reports unhealthy"
 
 
-def test_service_info(docker_containers):
+def test_service_info(docker_containers, http):
     """Test service info endpoints."""
-    services = [
-        ("ASR", ASR_BASE_URL),
-        ("TTS", TTS_BASE_URL),
-        ("Interface", INTERFACE_URL)
-    ]
-
-    for service_name, url in services:
-        response = requests.get(f"{url}/info", timeout=10)
+    for (service_name, _), response in zip(SERVICES, get_all(http, "/info")):
         assert response.status_code == 200, f"{service_name} info check failed with status {response.status_code}"
 
         data = response.json()
@@ -182,58 +208,37 @@ def test_service_info(docker_containers):
 
 
 @pytest.mark.integration
-def test_asr_transcription(docker_containers):
+def test_asr_transcription(docker_containers, http, synthesized_audio):
     """Test ASR transcription with a sample audio file."""
-    # Create a simple test audio file (this would be a real WAV in practice)
-    test_text = "Hello, this is a test of the ASR system."
-
     try:
-        # First, let's use TTS to create test audio
-        tts_response = requests.post(
-            f"{TTS_BASE_URL}/synthesize",
-            json={"text": test_text},
+        # Test ASR transcription, uploading the synthesized audio from memory
+        files = {"file": ("audio.wav", synthesized_audio[ASR_TEST_TEXT], "audio/wav")}
+        asr_response = http.post(
+            f"{ASR_BASE_URL}/transcribe",
+            files=files,
             timeout=30
         )
 
-        assert tts_response.status_code == 200, f"TTS synthesis failed: HTTP {tts_response.status_code}"
-
-        # Test ASR transcription
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(tts_response.content)
-            audio_path = temp_file.name
-
-        try:
-            with open(audio_path, "rb") as audio_file:
-                files = {"file": audio_file}
-                asr_response = requests.post(
-                    f"{ASR_BASE_URL}/transcribe",
-                    files=files,
-                    timeout=30
-                )
-
-            assert asr_response.status_code == 200, f"ASR transcription failed: HTTP {asr_response.status_code}"
+        assert asr_response.status_code == 200, \
+            f"ASR transcription failed: HTTP {asr_response.status_code}"
 
-            data = asr_response.json()
-            transcribed_text = data.get("text", "").strip()
+        data = asr_response.json()
+        transcribed_text = data.get("text", "").strip()
 
-            # Basic validation - should contain some text
-            assert len(transcribed_text) > 0, "ASR returned empty transcription"
-
-        finally:
-            if os.path.exists(audio_path):
-                os.unlink(audio_path)
+        # Basic validation - should contain some text
+        assert len(transcribed_text) > 0, "ASR returned empty transcription"
 
     except requests.exceptions.RequestException as e:
         pytest.fail(f"ASR transcription test failed: {e}")
 
 
 @pytest.mark.integration
-def test_tts_synthesis(docker_containers):
+def test_tts_synthesis(docker_containers, http):
     """Test TTS synthesis."""
     test_text = "This is a test of the text to speech system."
 
     try:
-        response = requests.post(
+        response = http.post(
             f"{TTS_BASE_URL}/synthesize",
             json={"text": test_text},
             timeout=30
@@ -251,54 +256,38 @@ def test_tts_synthesis(docker_containers):
 
 
 @pytest.mark.integration
-def test_full_pipeline(docker_containers):
+def test_full_pipeline(docker_containers, http, synthesized_audio):
     """Test full pipeline: Text -> Speech -> Text."""
-    original_text = "The quick brown fox jumps over the lazy dog."
+    original_text = PIPELINE_TEST_TEXT
 
     try:
-        # Step 1: Text to Speech
-        print("   Step 1: Converting text to speech...")
-        tts_response = requests.post(
-            f"{TTS_BASE_URL}/synthesize",
-            json={"text": original_text},
-            timeout=30
-        )
-
-        assert tts_response.status_code == 200, f"TTS failed: HTTP {tts_response.status_code}"
+        # Step 1: Text to Speech (synthesized with the other test texts in one batch)
+        audio = synthesized_audio[original_text]
+        assert len(audio) > 0, "TTS returned empty audio data"
 
         # Step 2: Speech to Text
         print("   Step 2: Converting speech to text...")
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(tts_response.content)
-            audio_path = temp_file.name
-
-        try:
-            with open(audio_path, "rb") as audio_file:
-                files = {"file": audio_file}
-                asr_response = requests.post(
-                    f"{ASR_BASE_URL}/transcribe",
-                    files=files,
-                    timeout=30
-                )
-
-            assert asr_response.status_code == 200, f"ASR failed: HTTP {asr_response.status_code}"
+        files = {"file": ("audio.wav", audio, "audio/wav")}
+        asr_response = http.post(
+            f"{ASR_BASE_URL}/transcribe",
+            files=files,
+            timeout=30
+        )
 
-            # Step 3: Compare results
-            data = asr_response.json()
-            final_text = data.get("text", "").strip()
+        assert asr_response.status_code == 200, f"ASR failed: HTTP {asr_response.status_code}"
 
-            # Simple accuracy check
-            original_words = set(original_text.lower().split())
-            final_words = set(final_text.lower().split())
-            common_words = original_words.intersection(final_words)
-            accuracy = len(common_words) / len(original_words) if original_words else 0
+        # Step 3: Compare results
+        data = asr_response.json()
+        final_text = data.get("text", "").strip()
 
-            # Assert reasonable accuracy (at least 50%)
-            assert accuracy >= 0.5, f"Round-trip accuracy too low: {accuracy:.1%}"
+        # Simple accuracy check
+        original_words = set(original_text.lower().split())
+        final_words = set(final_text.lower().split())
+        common_words = original_words.intersection(final_words)
+        accuracy = len(common_words) / len(original_words) if original_words else 0
 
-        finally:
-            if os.path.exists(audio_path):
-                os.unlink(audio_path)
+        # Assert reasonable accuracy (at least 50%)
+        assert accuracy >= 0.5, f"Round-trip accuracy too low: {accuracy:.1%}"
 
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Full pipeline test failed: {e}")
@@ -351,11 +340,11 @@ def test_auto_note_setup():
 
 
 @pytest.mark.integration
-def test_interface_service(docker_containers):
+def test_interface_service(docker_containers, http):
     """Test interface service functionality."""
     try:
         # Test basic interface access
-        response = requests.get(INTERFACE_URL, timeout=10)
+        response = http.get(INTERFACE_URL, timeout=10)
         # Interface might redirect or return HTML
         assert response.status_code in [200, 302], f"Interface service returned status {response.status_code}"
 
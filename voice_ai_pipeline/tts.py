@@ -1,20 +1,56 @@
 """TTS service using Coqui TTS for text-to-speech synthesis."""
 
+import asyncio
+import base64
+import contextlib
+import io
 import os
-from typing import Dict
+import struct
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, TypeVar
+import numpy as np
 from TTS.api import TTS
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import tempfile
 import torch
 
 
+T = TypeVar("T")
+
+# RIFF/data size for a WAV whose length is unknown when the header is sent
+WAV_STREAM_SIZE = 0xFFFFFFFF
+
+
+def wav_stream_header(sample_rate: int) -> bytes:
+    """Build the header of a mono 16-bit WAV stream of unknown length.
+
+    Args:
+        sample_rate: Sample rate of the audio that follows.
+
+    Returns:
+        The 44-byte RIFF/WAVE header, with both size fields set to the
+        maximum as decoders expect for streamed WAV.
+    """
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", WAV_STREAM_SIZE, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", WAV_STREAM_SIZE,
+    )
+
+
 class TextRequest(BaseModel):
     """Request model for text synthesis."""
     text: str
 
 
+class BatchTextRequest(BaseModel):
+    """Request model for synthesizing several texts at once."""
+    texts: List[str]
+
+
 class TTSService:
     """Text-to-Speech service using Coqui TTS.
 
@@ -22,17 +58,33 @@ class TTSService:
     text into audio files.
     """
 
-    def __init__(self, model_name: str = "tts_models/en/ljspeech/tacotron2-DDC_ph", use_gpu: bool | None = None) -> None:
+    def __init__(self, model_name: str = "tts_models/en/ljspeech/tacotron2-DDC_ph",
+                 use_gpu: bool | None = None, precision: str = "fp32",
+                 compile_model: bool = False) -> None:
         """Initialize the TTS service.
 
         Args:
             model_name: The name of the TTS model to use.
             use_gpu: Whether to use GPU acceleration. If None, auto-detect GPU availability.
+            precision: Inference precision: "fp32", "fp16" (autocast on GPU) or
+                "int8" (dynamic quantization of the acoustic model on CPU).
+            compile_model: Compile the acoustic model and vocoder with
+                torch.compile (startup pays the compile cost).
+
+        Raises:
+            ValueError: If the precision is not supported.
         """
+        if precision not in ("fp32", "fp16", "int8"):
+            raise ValueError(f"Unsupported TTS precision: {precision}")
         self.model_name = model_name
         self.use_gpu = use_gpu if use_gpu is not None else self._detect_gpu()
+        self.precision = precision
+        self.compile_model = compile_model
         self.tts: TTS | None = None
         self.load_model()
+        self._apply_precision()
+        if self.compile_model:
+            self._compile()
 
     def _detect_gpu(self) -> bool:
         """Detect if GPU is available for acceleration.
@@ -56,6 +108,8 @@ class TTSService:
             self.tts = TTS(self.model_name, gpu=self.use_gpu)
             device = "GPU" if self.use_gpu else "CPU"
             print(f"TTS model loaded successfully on {device}")
+            if not self.use_gpu:
+                self._map_weights()
         except Exception as e:
             # Try fallback to CPU if GPU failed
             if self.use_gpu:
@@ -64,11 +118,103 @@ class TTSService:
                 try:
                     self.tts = TTS(self.model_name, gpu=False)
                     print("TTS model loaded successfully on CPU (fallback)")
+                    self._map_weights()
                 except Exception as cpu_e:
                     raise RuntimeError(f"Failed to load TTS model {self.model_name} on both GPU and CPU: GPU error: {e}, CPU error: {cpu_e}")
             else:
                 raise RuntimeError(f"Failed to load TTS model {self.model_name}: {e}")
 
+    def _map_weights(self) -> None:
+        """Back the CPU model's weights with a memory map of its checkpoint.
+
+        The loaded parameters are replaced by tensors that point into the
+        checkpoint file, so they live in the page cache rather than in this
+        process's heap. Every worker serving the same model then shares one
+        copy of the weights. Keeps the weights already loaded if the
+        checkpoint cannot be mapped (e.g. the legacy non-zip format).
+        """
+        synthesizer = getattr(self.tts, "synthesizer", None)
+        checkpoint_path = getattr(synthesizer, "tts_checkpoint", None)
+        if not checkpoint_path:
+            return
+        try:
+            checkpoint = torch.load(checkpoint_path, map_location="cpu", mmap=True,
+                                    weights_only=False)
+            # assign=True keeps the mapped tensors instead of copying them in
+            synthesizer.tts_model.load_state_dict(checkpoint["model"], assign=True)
+            print("TTS model weights memory-mapped from checkpoint")
+        except Exception as e:
+            print(f"Could not memory-map TTS checkpoint ({e}), keeping loaded weights")
+
+    def _apply_precision(self) -> None:
+        """Quantize the loaded model or fall back to fp32 where the precision is unsupported."""
+        if self.precision == "fp16" and not self.use_gpu:
+            print("fp16 inference is GPU-only, using fp32")
+            self.precision = "fp32"
+        elif self.precision == "int8":
+            if self.use_gpu:
+                print("int8 dynamic quantization is CPU-only, using fp32")
+                self.precision = "fp32"
+                return
+            # Replaces the memory-mapped weights of these layers with packed int8 copies
+            synthesizer = self.tts.synthesizer
+            synthesizer.tts_model = torch.ao.quantization.quantize_dynamic(
+                synthesizer.tts_model, {torch.nn.Linear, torch.nn.LSTM, torch.nn.LSTMCell},
+                dtype=torch.qint8
+            )
+            print("TTS acoustic model quantized to int8")
+
+    def _compile(self) -> None:
+        """Compile the submodules of the acoustic model and vocoder with torch.compile.
+
+        Coqui drives its models through ``inference()`` rather than
+        ``forward()``, so each child module's forward is compiled instead of
+        the top-level model. A trial synthesis runs the compilation here; if
+        it fails, the original forwards are restored and the model runs eagerly.
+        """
+        synthesizer = self.tts.synthesizer
+        models = [synthesizer.tts_model, getattr(synthesizer, "vocoder_model", None)]
+        modules = [module for model in models if model is not None for module in model.children()]
+        originals = [(module, module.forward) for module in modules]
+        # CUDA graphs cut kernel launch overhead; dynamic=True avoids recompiling per text length
+        mode = "reduce-overhead" if self.use_gpu else "default"
+        for module in modules:
+            module.forward = torch.compile(module.forward, mode=mode, dynamic=True)
+
+        try:
+            with self._precision_context():
+                self.tts.tts(text="Compiling the model.")
+            print(f"TTS model compiled ({mode})")
+        except Exception as e:
+            print(f"torch.compile failed ({e}), running the TTS model eagerly")
+            for module, forward in originals:
+                module.forward = forward
+            self.compile_model = False
+
+    def _precision_context(self):
+        """Return the autocast context for fp16 inference (a no-op otherwise)."""
+        if self.precision == "fp16":
+            return torch.autocast("cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
+
+    def warmup(self) -> None:
+        """Run a dummy synthesis to initialize the model.
+
+        Synthesizing a short sentence in memory allocates the decoder and
+        vocoder buffers and triggers kernel selection so the first real
+        request does not pay for it.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        if self.tts is None:
+            raise RuntimeError("TTS model not loaded")
+
+        with self._precision_context():
+            self.tts.tts(text="Warming up.")
+        if self.use_gpu:
+            torch.cuda.synchronize()
+
     def synthesize(self, text: str, output_path: str) -> None:
         """Synthesize text into an audio file.
 
@@ -82,7 +228,76 @@ class TTSService:
         if self.tts is None:
             raise RuntimeError("TTS model not loaded")
 
-        self.tts.tts_to_file(text=text, file_path=output_path)
+        with self._precision_context():
+            self.tts.tts_to_file(text=text, file_path=output_path)
+
+    def synthesize_wav(self, text: str) -> bytes:
+        """Synthesize text into an in-memory WAV file.
+
+        The waveform is peak-normalized to 16-bit PCM, matching the files
+        written by ``synthesize``.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            The WAV file contents.
+
+        Raises:
+            RuntimeError: If the model is not loaded or produced no audio.
+        """
+        if self.tts is None:
+            raise RuntimeError("TTS model not loaded")
+
+        with self._precision_context():
+            wav = np.asarray(self.tts.tts(text=text), dtype=np.float32)
+        if wav.size == 0:
+            raise RuntimeError("Synthesis produced no audio")
+        pcm = (wav * (32767 / max(0.01, float(np.max(np.abs(wav)))))).astype(np.int16)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.tts.synthesizer.output_sample_rate)
+            wf.writeframes(pcm.tobytes())
+        return buffer.getvalue()
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """Synthesize text sentence by sentence, yielding 16-bit PCM chunks.
+
+        Each sentence is synthesized only when the next chunk is requested, so
+        a consumer can send audio while later sentences are still being
+        generated. Chunks are scaled by the running peak of the utterance so
+        far, so the gain never rises between sentences and matches
+        ``synthesize_wav`` whenever the first sentence holds the peak. Each
+        chunk already ends with the pause Coqui appends after a sentence.
+
+        Args:
+            text: The text to synthesize.
+
+        Yields:
+            Mono 16-bit PCM at ``self.tts.synthesizer.output_sample_rate``,
+            one chunk per sentence.
+
+        Raises:
+            RuntimeError: If the model is not loaded or produced no audio.
+        """
+        if self.tts is None:
+            raise RuntimeError("TTS model not loaded")
+
+        produced = False
+        peak = 0.01
+        for sentence in self.tts.synthesizer.split_into_sentences(text):
+            with self._precision_context():
+                wav = np.asarray(self.tts.tts(text=sentence), dtype=np.float32)
+            if wav.size == 0:
+                continue
+            produced = True
+            peak = max(peak, float(np.max(np.abs(wav))))
+            yield (wav * (32767 / peak)).astype(np.int16).tobytes()
+        if not produced:
+            raise RuntimeError("Synthesis produced no audio")
 
     def get_model_info(self) -> Dict[str, str]:
         """Get information about the loaded model.
@@ -93,6 +308,8 @@ class TTSService:
         return {
             "model_name": self.model_name,
             "device": "cuda" if self.use_gpu else "cpu",
+            "precision": self.precision,
+            "compiled": str(self.compile_model),
             "loaded": str(self.tts is not None)
         }
 
@@ -109,51 +326,100 @@ app = FastAPI(title="TTS Service", description="Text-to-speech synthesis service
 
 tts_service = TTSService(
     model_name=os.getenv("TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC_ph"),
-    use_gpu=os.getenv("USE_GPU", "true").lower() == "true"
+    use_gpu=os.getenv("USE_GPU", "true").lower() == "true",
+    precision=os.getenv("TTS_PRECISION", "fp32"),
+    compile_model=os.getenv("TTS_COMPILE", "false").lower() == "true"
 )
 
+# Coqui models are not thread-safe, so synthesis runs on one dedicated
+# thread; concurrent requests queue there instead of blocking the event loop.
+_synthesis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+
+async def _run_synthesis(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking synthesis call on the synthesis thread.
+
+    Keeps the event loop free for other requests (such as /health) while the
+    model is busy.
+
+    Args:
+        func: The blocking TTS method to call.
+        *args: Positional arguments passed to ``func``.
+
+    Returns:
+        The return value of ``func``.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_synthesis_executor, func, *args)
+
+
+@app.on_event("startup")
+async def warmup() -> None:
+    """Warm up the TTS model before serving requests."""
+    try:
+        await _run_synthesis(tts_service.warmup)
+        print("TTS model warmed up")
+    except Exception as e:
+        print(f"TTS warmup failed: {e}")
+
 
 @app.post("/synthesize")
-async def synthesize(request: TextRequest) -> FileResponse:
-    """Synthesize text into speech audio.
+async def synthesize(request: TextRequest) -> StreamingResponse:
+    """Synthesize text into speech audio, streamed as it is generated.
+
+    The WAV header and first sentence are sent as soon as that sentence is
+    synthesized; the remaining sentences follow one chunk at a time.
 
     Args:
         request: The text synthesis request.
 
     Returns:
-        The synthesized audio file.
+        The synthesized audio as a streamed WAV file.
 
     Raises:
-        HTTPException: If synthesis fails.
+        HTTPException: If synthesis of the first sentence fails.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-        temp_path = temp_file.name
-
+    chunks = tts_service.synthesize_stream(request.text)
+    # Synthesize the first sentence before responding so failures still get a 500
     try:
-        print(f"Starting synthesis to: {temp_path}")
-        tts_service.synthesize(request.text, temp_path)
-        
-        # Check if file was created and has content
-        if not os.path.exists(temp_path):
-            raise HTTPException(status_code=500, detail=f"Output file was not created: {temp_path}")
-        
-        file_size = os.path.getsize(temp_path)
-        print(f"Synthesis completed. File size: {file_size} bytes")
-        
-        if file_size == 0:
-            raise HTTPException(status_code=500, detail="Output file is empty")
-        
-        return FileResponse(
-            temp_path,
-            media_type="audio/wav",
-            filename="output.wav"
-        )
+        first = await _run_synthesis(next, chunks)
     except Exception as e:
         print(f"Synthesis error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Synthesis failed: {str(e)}")
-    finally:
-        # Don't delete the file immediately - let FastAPI handle it
-        pass
+
+    async def audio() -> AsyncIterator[bytes]:
+        yield wav_stream_header(tts_service.tts.synthesizer.output_sample_rate) + first
+        # Each sentence is synthesized on the synthesis thread while the previous one is sent
+        while (chunk := await _run_synthesis(next, chunks, None)) is not None:
+            yield chunk
+
+    return StreamingResponse(
+        audio(),
+        media_type="audio/wav",
+        headers={"Content-Disposition": 'attachment; filename="output.wav"'}
+    )
+
+
+@app.post("/synthesize_batch")
+async def synthesize_batch(request: BatchTextRequest) -> Dict[str, List[str]]:
+    """Synthesize several texts in one request.
+
+    Args:
+        request: The batch synthesis request.
+
+    Returns:
+        Dictionary with the base64-encoded WAV file of each text, in request order.
+
+    Raises:
+        HTTPException: If synthesis fails.
+    """
+    try:
+        wavs = [await _run_synthesis(tts_service.synthesize_wav, text) for text in request.texts]
+    except Exception as e:
+        print(f"Batch synthesis error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Synthesis failed: {str(e)}")
+
+    return {"audio": [base64.b64encode(wav).decode("ascii") for wav in wavs]}
 
 
 @app.get("/health")
@@ -30,7 +30,7 @@ import keyboard
 import pyautogui
 from typing import Optional, Callable
 import requests
-import tempfile
+import io
 import pyaudio
 import wave
 import numpy as np
@@ -59,6 +59,9 @@ class VoiceCopilotOverlay:
         self.recording_state = RecordingState.IDLE
         self.audio_frames = []
 
+        # Keep-alive connections to the ASR and MCP services, reused across recordings
+        self.session = requests.Session()
+
         # Initialize audio
         self.audio = pyaudio.PyAudio()
         self.stream: Optional[pyaudio.Stream] = None
@@ -192,19 +195,16 @@ class VoiceCopilotOverlay:
                 self.recording_state = RecordingState.IDLE
                 return
 
-            # Save to temporary WAV file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-                temp_path = temp_file.name
-
-                # Write WAV file
-                with wave.open(temp_path, 'wb') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(16000)
-                    wf.writeframes(b''.join(self.audio_frames))
+            # Build the WAV in memory; it is only needed for the upload
+            wav_buffer = io.BytesIO()
+            with wave.open(wav_buffer, 'wb') as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(16000)
+                wf.writeframes(b''.join(self.audio_frames))
 
             # Send to ASR service
-            transcription = self.transcribe_audio(temp_path)
+            transcription = self.transcribe_audio(wav_buffer.getvalue())
 
             if transcription:
                 # Send to Copilot
@@ -216,21 +216,19 @@ class VoiceCopilotOverlay:
             else:
                 self.update_ui("❌ Transcription failed", "#ff6666")
 
-            # Cleanup
-            os.unlink(temp_path)
-
         except Exception as e:
             self.update_ui(f"❌ Error: {str(e)}", "#ff6666")
         finally:
             self.recording_state = RecordingState.IDLE
 
-    def transcribe_audio(self, audio_path: str) -> Optional[str]:
-        """Send audio to ASR service for transcription."""
+    def transcribe_audio(self, wav_bytes: bytes) -> Optional[str]:
+        """Send WAV audio to ASR service for transcription."""
         try:
             asr_url = self.config.get("asr_url", "http://localhost:8000/transcribe")
 
-            with open(audio_path, "rb") as f:
-                response = requests.post(asr_url, files={"file": f}, timeout=30)
+            response = self.session.post(
+                asr_url, files={"file": ("recording.wav", wav_bytes, "audio/wav")}, timeout=30
+            )
 
             if response.status_code == 200:
                 return response.json().get("text", "").strip()
@@ -267,7 +265,7 @@ class VoiceCopilotOverlay:
                 }
             }
 
-            response = requests.post(mcp_url, json=mcp_request, timeout=30)
+            response = self.session.post(mcp_url, json=mcp_request, timeout=30)
 
             if response.status_code == 200:
                 print("✅ Sent to Copilot successfully")
@@ -383,6 +381,7 @@ class VoiceCopilotOverlay:
             self.stream.stop_stream()
             self.stream.close()
         self.audio.terminate()
+        self.session.close()
         self.root.destroy()
 
     def run(self):